@@ -1,46 +1,129 @@
-from flask import Flask, jsonify
-from main import CricketScraperApp
+import os
+import hashlib
+from datetime import datetime
+from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+from scraper.data_store import DataStore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize an object to a JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Build a JSON response straight from orjson's bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json"
+        )
 
 app = Flask(__name__)
-cricket_app = CricketScraperApp()
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Compress JSON responses large enough to benefit (match data with scorecards)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
+# Short-lived response cache so bursts of polling clients share one computation.
+# Set CACHE_TYPE=RedisCache and CACHE_REDIS_URL to share it across workers.
+cache = Cache(app, config={
+    'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': 5
+})
+
+# The scraper runs in its own process (main.py), the API only reads what it stores
+data_store = DataStore()
+
+def _conditional_response(build_payload, etag=None):
+    """Build a JSON response with an ETag, or a 304 if the client already has it.
+    
+    When no etag is given it is derived from the serialized body.
+    """
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+    
+    response = jsonify(build_payload())
+    if etag is None:
+        etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        if request.if_none_match.contains_weak(etag):
+            return _not_modified(etag)
+    
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'public, max-age=5'
+    return response
+
+def _cached_payload(key, timeout, build_payload):
+    """Get a payload from the cache, building and caching it on a miss"""
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_payload()
+        cache.set(key, payload, timeout=timeout)
+    return payload
+
+def _not_modified(etag):
+    """Build an empty 304 response for the given etag"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'public, max-age=5'
+    return response
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get the current status of the cricket scraper"""
-    status = cricket_app.get_status()
-    return jsonify({
-        'status': 'success',
-        'data': status,
-        'timestamp': status.get('timestamp')
-    })
+    def build():
+        status = {
+            "scheduler": data_store.get_scheduler_status(),
+            "data_store": data_store.get_storage_stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+        return {
+            'status': 'success',
+            'data': status,
+            'timestamp': status.get('timestamp')
+        }
+    return _conditional_response(lambda: _cached_payload('status', 15, build))
 
 @app.route('/api/matches', methods=['GET'])
 def get_matches():
     """Get the list of matches"""
-    matches = cricket_app.data_store.get_match_list()
-    return jsonify({
-        'status': 'success',
-        'data': {
-            'matches': matches,
-            'count': len(matches)
+    def build():
+        matches = data_store.get_match_list()
+        return {
+            'status': 'success',
+            'data': {
+                'matches': matches,
+                'count': len(matches)
+            }
         }
-    })
+    # The version (the file's inode, mtime and size) is part of the key, so a rewrite within
+    # one mtime tick still gets a new key rather than the stale cached payload
+    etag = data_store.get_match_list_version()
+    return _conditional_response(lambda: _cached_payload(f'matches:{etag}', 10, build), etag)
 
 @app.route('/api/matches/<match_id>', methods=['GET'])
 def get_match_data(match_id):
     """Get data for a specific match"""
-    match_data = cricket_app.data_store.get_match_data(match_id)
-    return jsonify({
-        'status': 'success',
-        'data': match_data
-    })
-
-if __name__ == '__main__':
-    # Start the cricket scraper in a separate thread
-    import threading
-    scraper_thread = threading.Thread(target=cricket_app.start)
-    scraper_thread.daemon = True
-    scraper_thread.start()
-    
-    # Start the API server
-    app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
+    def build():
+        return {
+            'status': 'success',
+            'data': data_store.get_match_data(match_id)
+        }
+    etag = data_store.get_match_data_version(match_id)
+    return _conditional_response(build, etag)
\ No newline at end of file
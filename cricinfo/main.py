@@ -1,8 +1,9 @@
 import os
-import time
 import json
 import logging
+import threading
 from datetime import datetime
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from scraper.scheduler import MatchScheduler
 from scraper.data_store import DataStore
@@ -37,7 +38,14 @@ class CricketScraperApp:
         # Initialize components
         self.data_store = DataStore(data_dir)
         self.scheduler = MatchScheduler(self.data_store)
-        self.background_scheduler = BackgroundScheduler()
+        self.background_scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(10)},
+            job_defaults={'coalesce': True, 'max_instances': 1},
+            daemon=True
+        )
+        
+        # Set by stop() to release the main thread parked in start()
+        self._stop_event = threading.Event()
         
     def start(self):
         """Start the Cricket Scraper application"""
@@ -62,28 +70,36 @@ class CricketScraperApp:
                 id='check_match_status'
             )
             
+            self.background_scheduler.add_job(
+                self.store_status, 
+                'interval', 
+                minutes=1,
+                id='store_status'
+            )
+            
             # Start the scheduler
             self.background_scheduler.start()
             
             # Initial update of match list
             self.scheduler.update_match_list()
+            self.store_status()
             
             logger.info("Cricket Scraper Application started successfully")
             
-            # Keep the main thread alive
+            # Keep the main thread alive without waking it up until we're stopped
             try:
-                while True:
-                    time.sleep(1)
+                self._stop_event.wait()
             except KeyboardInterrupt:
                 self.stop()
                 
         except Exception as e:
-            logger.error(f"Failed to start Cricket Scraper Application: {str(e)}", exc_info=True)
+            logger.error("Failed to start Cricket Scraper Application: %s", e, exc_info=True)
             self.stop()
     
     def stop(self):
         """Stop the Cricket Scraper application"""
         logger.info("Stopping Cricket Scraper Application")
+        self._stop_event.set()
         
         # Stop the scheduler
         self.scheduler.stop()
@@ -94,6 +110,13 @@ class CricketScraperApp:
             
         logger.info("Cricket Scraper Application stopped")
     
+    def store_status(self):
+        """Persist the scheduler status for the API process"""
+        try:
+            self.data_store.store_scheduler_status(self.scheduler.get_status())
+        except Exception as e:
+            logger.error("Failed to store scheduler status: %s", e, exc_info=True)
+    
     def get_status(self):
         """Get the current status of the application"""
         return {
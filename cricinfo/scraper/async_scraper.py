@@ -0,0 +1,269 @@
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
+from scraper.data_store import DataStore
+
+logger = logging.getLogger(__name__)
+
+# Same user agent as the Chrome scrapers
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+def _text(node) -> str:
+    """Get the trimmed text content of a node, or an empty string if there is none"""
+    return node.text().strip() if node is not None else ""
+
+def _select_all(node, selector: str) -> list:
+    """Select nodes like querySelectorAll, without the duplicates lexbor returns for selector lists"""
+    seen = set()
+    result = []
+    for match in node.css(selector):
+        if match.mem_id not in seen:
+            seen.add(match.mem_id)
+            result.append(match)
+    return result
+
+def parse_match_info(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
+    """Extract match information from a parsed match page"""
+    if tree.css_first('[class*="info"]') is None:
+        return None
+    
+    def get_text(sel):
+        return _text(tree.css_first(sel))
+    
+    return {
+        "teams": {
+            "home": get_text(".team-home, .teamA, .team1, .team-left"),
+            "away": get_text(".team-away, .teamB, .team2, .team-right")
+        },
+        "matchDetails": {
+            "series": get_text(".series-name, .series"),
+            "format": get_text(".match-format, .format"),
+            "venue": get_text(".venue-name, .venue"),
+            "date": get_text(".match-date, .date"),
+            "time": get_text(".match-time, .time"),
+            "toss": get_text(".toss-result, .toss"),
+            "umpires": [_text(el) for el in _select_all(tree, ".umpire, .umpires")]
+        }
+    }
+
+def parse_squads(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
+    """Extract team squads from a parsed match page"""
+    container = tree.css_first('[class*="squad"]')
+    if container is None:
+        return None
+    
+    def extract_players(team_selector):
+        players = _select_all(container, f"{team_selector} .player, {team_selector} .player-row, {team_selector} .player-item")
+        return [
+            {
+                "name": _text(player.css_first(".player-name")) or _text(player),
+                "role": _text(player.css_first(".player-role")),
+                "isCaptain": player.css_first(".captain-indicator, .captain") is not None,
+                "isWicketkeeper": player.css_first(".wicketkeeper-indicator, .wicketkeeper") is not None
+            }
+            for player in players
+        ]
+    
+    return {
+        "homeTeam": {
+            "name": _text(container.css_first(".home-team-name, .teamA, .team1, .team-left")),
+            "players": extract_players(".home-team-squad, .teamA, .team1, .team-left")
+        },
+        "awayTeam": {
+            "name": _text(container.css_first(".away-team-name, .teamB, .team2, .team-right")),
+            "players": extract_players(".away-team-squad, .teamB, .team2, .team-right")
+        }
+    }
+
+def parse_scorecard(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
+    """Extract the scorecard from a parsed match page"""
+    container = tree.css_first('[class*="scorecard"]')
+    if container is None:
+        return None
+    
+    def extract_innings(innings_selector):
+        innings = container.css_first(innings_selector)
+        if innings is None:
+            return None
+        
+        def get_text(el, sel):
+            return _text(el.css_first(sel))
+        
+        return {
+            "team": get_text(innings, ".innings-team"),
+            "totalScore": get_text(innings, ".innings-total"),
+            "overs": get_text(innings, ".innings-overs"),
+            "extras": get_text(innings, ".innings-extras"),
+            "batsmen": [
+                {
+                    "name": get_text(row, ".batsman-name") or _text(row),
+                    "dismissal": get_text(row, ".batsman-dismissal"),
+                    "runs": get_text(row, ".batsman-runs"),
+                    "balls": get_text(row, ".batsman-balls"),
+                    "fours": get_text(row, ".batsman-fours"),
+                    "sixes": get_text(row, ".batsman-sixes"),
+                    "strikeRate": get_text(row, ".batsman-strike-rate")
+                }
+                for row in _select_all(innings, ".batsman-row")
+            ],
+            "bowlers": [
+                {
+                    "name": get_text(row, ".bowler-name") or _text(row),
+                    "overs": get_text(row, ".bowler-overs"),
+                    "maidens": get_text(row, ".bowler-maidens"),
+                    "runs": get_text(row, ".bowler-runs"),
+                    "wickets": get_text(row, ".bowler-wickets"),
+                    "economy": get_text(row, ".bowler-economy")
+                }
+                for row in _select_all(innings, ".bowler-row")
+            ],
+            "fallOfWickets": [_text(item) for item in _select_all(innings, ".fow-item")]
+        }
+    
+    innings = [extract_innings(f".innings-{i}") for i in range(1, 5)]
+    return {
+        "innings": [i for i in innings if i],
+        "matchSummary": _text(container.css_first(".match-summary")),
+        "playerOfTheMatch": _text(container.css_first(".player-of-match"))
+    }
+
+def parse_live_data(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
+    """Extract live match data from a parsed match page"""
+    container = tree.css_first('[class*="live"]')
+    if container is None:
+        return None
+    
+    def get_text(el, sel):
+        return _text(el.css_first(sel))
+    
+    return {
+        "currentInnings": get_text(container, ".current-innings"),
+        "score": get_text(container, ".current-score, .score"),
+        "runRate": get_text(container, ".run-rate"),
+        "requiredRunRate": get_text(container, ".required-run-rate"),
+        "lastWicket": get_text(container, ".last-wicket"),
+        "recentBalls": [_text(el) for el in _select_all(container, ".recent-ball")],
+        "partnership": get_text(container, ".current-partnership"),
+        "batsmen": [
+            {
+                "name": get_text(el, ".batsman-name") or _text(el),
+                "runs": get_text(el, ".batsman-runs"),
+                "balls": get_text(el, ".batsman-balls"),
+                "fours": get_text(el, ".batsman-fours"),
+                "sixes": get_text(el, ".batsman-sixes"),
+                "strikeRate": get_text(el, ".batsman-strike-rate")
+            }
+            for el in _select_all(container, ".batsman, .batsman-row")
+        ],
+        "bowlers": [
+            {
+                "name": get_text(el, ".bowler-name") or _text(el),
+                "overs": get_text(el, ".bowler-overs"),
+                "maidens": get_text(el, ".bowler-maidens"),
+                "runs": get_text(el, ".bowler-runs"),
+                "wickets": get_text(el, ".bowler-wickets"),
+                "economy": get_text(el, ".bowler-economy")
+            }
+            for el in _select_all(container, ".bowler, .bowler-row")
+        ],
+        "matchStatus": get_text(container, ".match-status, .status"),
+        "commentary": [
+            {
+                "text": get_text(el, ".commentary-text") or _text(el),
+                "over": get_text(el, ".commentary-over"),
+                "timestamp": get_text(el, ".commentary-timestamp")
+            }
+            for el in _select_all(container, ".commentary-item, .commentary-row")[:10]
+        ]
+    }
+
+def parse_match_ended(tree: LexborHTMLParser) -> bool:
+    """Check a parsed match page's status for a finished match"""
+    status = _text(tree.css_first(".match-status")).lower()
+    return any(marker in status for marker in ("match ended", "completed", "won by", "drawn"))
+
+class AsyncMatchScraper:
+    """Browserless scraper for server-rendered match pages: info, squads and scorecard, plus live data and status on each tracking tick"""
+    
+    def __init__(self, data_store: DataStore, timeout: int = 15):
+        """Initialize the async match scraper"""
+        self.data_store = data_store
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+    
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> str:
+        """Fetch a page's HTML"""
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+    
+    def session(self) -> aiohttp.ClientSession:
+        """Open a keep-alive session with the scraper's headers and timeout"""
+        return aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}, timeout=self.timeout)
+    
+    async def fetch_tick(self, session: aiohttp.ClientSession, match_url: str) -> Dict[str, Any]:
+        """Fetch a match page and extract live data, scorecard and status, like the browser's per-tick extraction"""
+        tree = LexborHTMLParser(await self._fetch(session, match_url))
+        return {
+            "live": parse_live_data(tree),
+            "scorecard": parse_scorecard(tree),
+            "ended": parse_match_ended(tree)
+        }
+    
+    async def scrape_match(self, session: aiohttp.ClientSession, match_id: str, match_url: str, include_scorecard: bool = False):
+        """Scrape and store match info and squads (and optionally the scorecard) for one match"""
+        logger.info(f"Fetching match page for {match_id}")
+        tree = LexborHTMLParser(await self._fetch(session, match_url))
+        
+        match_info = parse_match_info(tree)
+        if not match_info:
+            raise Exception("Failed to extract match information")
+        self.data_store.store_match_info(match_id, match_info)
+        
+        squads = parse_squads(tree)
+        if not squads:
+            raise Exception("Failed to extract squads information")
+        self.data_store.store_squads(match_id, squads)
+        
+        if include_scorecard:
+            scorecard = parse_scorecard(tree)
+            if not scorecard:
+                raise Exception("Failed to extract scorecard data")
+            self.data_store.store_scorecard(match_id, scorecard)
+        
+        logger.info(f"Successfully scraped match page for {match_id}")
+    
+    async def _scrape_match_with_retries(self, session: aiohttp.ClientSession, match_id: str, match_url: str,
+                                         include_scorecard: bool, retries: int, retry_delay: float):
+        """Scrape one match, retrying with exponential backoff"""
+        for attempt in range(retries + 1):
+            try:
+                return await self.scrape_match(session, match_id, match_url, include_scorecard)
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                logger.info(f"Retrying match page for {match_id} ({attempt + 1}/{retries}): {str(e)}")
+                await asyncio.sleep(retry_delay * 2 ** attempt)
+    
+    async def scrape_matches_async(self, matches: List[Tuple[str, str]], include_scorecard: bool = False,
+                                   retries: int = 0, retry_delay: float = 5) -> Dict[str, bool]:
+        """Scrape several matches concurrently over one keep-alive session, retrying each up to retries times"""
+        async with self.session() as session:
+            results = await asyncio.gather(
+                *(self._scrape_match_with_retries(session, match_id, url, include_scorecard, retries, retry_delay)
+                  for match_id, url in matches),
+                return_exceptions=True
+            )
+        
+        outcome = {}
+        for (match_id, _), result in zip(matches, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping match page for {match_id}: {str(result)}", exc_info=result)
+            outcome[match_id] = not isinstance(result, BaseException)
+        return outcome
+    
+    def scrape_matches(self, matches: List[Tuple[str, str]], include_scorecard: bool = False,
+                       retries: int = 0, retry_delay: float = 5) -> Dict[str, bool]:
+        """Scrape several matches from synchronous code, returning success per match id"""
+        return asyncio.run(self.scrape_matches_async(matches, include_scorecard, retries, retry_delay))
\ No newline at end of file
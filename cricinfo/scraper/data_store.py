@@ -1,11 +1,171 @@
 import os
 import json
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional
+
+import ijson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for independent file reads and directory walks
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ds-io')
+
+# Last (epoch second, formatted prefix) used for snapshot timestamps
+_timestamp_prefix = (-1, "")
+
+def _snapshot_timestamp() -> str:
+    """Get a snapshot timestamp with nanoseconds, formatting the date part at most once per second"""
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%d-%H-%M-%S", time.localtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}-{nanos:09d}"
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize an object to JSON bytes, indented unless it's an NDJSON record"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _digest(data: bytes) -> bytes:
+    """Get a short content hash of serialized data"""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+def _atomic_write_json(path: str, obj: Any):
+    """Write JSON to a temp file and rename it into place so readers never see a partial file"""
+    _atomic_write_bytes(path, _dumps(obj))
+
+def _atomic_write_bytes(path: str, data: bytes):
+    """Write bytes to a temp file and rename it into place"""
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _read_json_or_none(path: str) -> Any:
+    """Read a JSON file, returning None if it doesn't exist"""
+    try:
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    except FileNotFoundError:
+        return None
+
+def _read_last_record(path: str) -> Any:
+    """Read the data of the last complete record in an NDJSON log, returning None if there is none"""
+    try:
+        with open(path, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            tail = b''
+            
+            # Read backwards until the last complete line is fully in the buffer
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                
+                end = tail.rfind(b'\n')
+                if end == -1:
+                    continue
+                start = tail.rfind(b'\n', 0, end)
+                if start != -1 or pos == 0:
+                    return _loads(tail[start + 1:end])['data']
+            return None
+    except FileNotFoundError:
+        return None
+
+@lru_cache(maxsize=1024)
+def _load_section_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Load a match section; mtime and size are part of the key so rewrites miss the cache"""
+    if path.endswith(".ndjson"):
+        return _read_last_record(path)
+    return _read_json_or_none(path)
+
+def _load_section(path: str) -> Any:
+    """Load a match section, returning None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _load_section_cached(path, st.st_mtime_ns, st.st_size)
+
+def _file_version(path: str) -> Optional[tuple]:
+    """Identify a file's current contents by inode, mtime and size, or None if it doesn't exist.
+    
+    Writes are atomic replaces, so each one gets a new inode even within the filesystem's mtime resolution.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _count_statuses(statuses) -> tuple:
+    """Count matches overall and by status in a single pass"""
+    total = 0
+    counts = {
+        "UPCOMING": 0,
+        "LIVE": 0,
+        "COMPLETED": 0
+    }
+    for status in statuses:
+        total += 1
+        if status in counts:
+            counts[status] += 1
+    return total, counts
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Size of a directory entry, or 0 if it was renamed or removed since it was listed"""
+    # Atomic writes rename their temp files into place while the stats walk runs
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except FileNotFoundError:
+        return 0
+
+def _get_dir_size(path: str) -> int:
+    """Calculate directory size, walking it with an explicit stack"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += _entry_size(entry)
+        except FileNotFoundError:
+            continue
+    return total
+
 class DataStore:
     """Data storage for cricket match data"""
     
@@ -13,6 +173,22 @@ class DataStore:
         """Initialize the data store"""
         self.base_dir = base_dir
         self.match_list_file = os.path.join(self.base_dir, "match-list.json")
+        self.status_file = os.path.join(self.base_dir, "status.json")
+        
+        # Parsed match list cache, invalidated when the file's version changes
+        self._ml_cache = None
+        self._ml_version = None
+        self._ml_lock = threading.Lock()
+        
+        # (match list version, total, counts by status), kept current on writes
+        self._status_counts = (None, 0, {})
+        
+        # Storage stats are expensive to compute, keep them for a short while
+        self._stats_cache = (0.0, None)
+        self._stats_ttl = 30  # seconds
+        
+        # Hash of the last stored content per section and match, used to skip duplicates
+        self._last_hash = {"info": {}, "squads": {}, "live": {}, "scorecard": {}}
         
         # Create base directory if it doesn't exist
         os.makedirs(self.base_dir, exist_ok=True)
@@ -23,216 +199,347 @@ class DataStore:
     def store_match_list(self, matches: List[Dict[str, Any]]):
         """Store match list"""
         try:
-            with open(self.match_list_file, 'w', encoding='utf-8') as f:
-                json.dump(matches, f, indent=2)
-            
-            logger.info(f"Stored {len(matches)} matches in match list")
+            with self._ml_lock:
+                _atomic_write_json(self.match_list_file, matches)
+                
+                # Refresh the cache with what was just written
+                self._ml_cache = list(matches)
+                self._ml_version = _file_version(self.match_list_file)
+                
+                # Status counts come from the same pass, so stats never need to rescan
+                total, counts = _count_statuses(match.get('status') for match in matches)
+                self._status_counts = (self._ml_version, total, counts)
+            
+            logger.info("Stored %d matches in match list", len(matches))
         except Exception as e:
-            logger.error(f"Failed to store match list: {str(e)}", exc_info=True)
+            logger.error("Failed to store match list: %s", e, exc_info=True)
             raise
     
     def get_match_list(self) -> List[Dict[str, Any]]:
         """Get match list"""
         try:
-            if not os.path.exists(self.match_list_file):
+            version = _file_version(self.match_list_file)
+            if version is None:
                 return []
             
-            with open(self.match_list_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Serve from cache if the file hasn't changed since it was parsed
+            if version == self._ml_version:
+                return list(self._ml_cache)
+            
+            with self._ml_lock:
+                if version != self._ml_version:
+                    with open(self.match_list_file, 'rb') as f:
+                        self._ml_cache = _loads(f.read())
+                    self._ml_version = version
+                return list(self._ml_cache)
         except Exception as e:
-            logger.error(f"Failed to get match list: {str(e)}", exc_info=True)
+            logger.error("Failed to get match list: %s", e, exc_info=True)
             return []
     
+    def iter_match_statuses(self) -> Iterator[Optional[str]]:
+        """Iterate over the status of each match without materializing the match list"""
+        version = _file_version(self.match_list_file)
+        if version is None:
+            return
+        
+        # Use the parsed list if it's already cached
+        if version == self._ml_version:
+            for match in self._ml_cache:
+                yield match.get('status')
+            return
+        
+        # Otherwise stream the file, yielding once per match object
+        status = None
+        with open(self.match_list_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'item.status':
+                    status = value
+                elif prefix == 'item' and event == 'end_map':
+                    yield status
+                    status = None
+    
     def update_match_status(self, match_id: str, status: str):
         """Update match status"""
+        self.bulk_update_match_statuses({match_id: status})
+    
+    def bulk_update_match_statuses(self, updates: Dict[str, str]):
+        """Update the status of several matches with a single match list write"""
         try:
             # Get current match list
             matches = self.get_match_list()
+            index = {match['id']: i for i, match in enumerate(matches)}
             
-            # Find and update match status
-            for match in matches:
-                if match['id'] == match_id:
-                    match['status'] = status
-                    break
+            # Update each match found (copy the dict, the list is shared with the cache)
+            changed = 0
+            for match_id, status in updates.items():
+                i = index.get(match_id)
+                if i is not None and matches[i].get('status') != status:
+                    matches[i] = {**matches[i], 'status': status}
+                    changed += 1
+            
+            # A newly scheduled match is already stored as UPCOMING, so often there's nothing to write
+            if not changed:
+                logger.debug("Match statuses %s unchanged, skipping", list(updates))
+                return
             
             # Store updated match list
             self.store_match_list(matches)
             
-            logger.info(f"Updated status of match {match_id} to {status}")
+            logger.info("Updated status of %d matches", changed)
         except Exception as e:
-            logger.error(f"Failed to update status of match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to update status of matches %s: %s", list(updates), e, exc_info=True)
             raise
     
     def store_match_info(self, match_id: str, match_info: Dict[str, Any]):
         """Store match info"""
         try:
-            match_dir = self._get_match_dir(match_id)
-            
-            # Create match directory if it doesn't exist
-            os.makedirs(match_dir, exist_ok=True)
-            
-            # Write match info to file
-            with open(os.path.join(match_dir, "info.json"), 'w', encoding='utf-8') as f:
-                json.dump(match_info, f, indent=2)
-            
-            logger.info(f"Stored info for match {match_id}")
+            if self._write_section("info", match_id, match_info):
+                logger.info("Stored info for match %s", match_id)
+            else:
+                logger.info("Info for match %s unchanged, skipping", match_id)
         except Exception as e:
-            logger.error(f"Failed to store info for match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to store info for match %s: %s", match_id, e, exc_info=True)
             raise
     
     def store_squads(self, match_id: str, squads: Dict[str, Any]):
         """Store squads"""
         try:
-            match_dir = self._get_match_dir(match_id)
-            
-            # Create match directory if it doesn't exist
-            os.makedirs(match_dir, exist_ok=True)
-            
-            # Write squads to file
-            with open(os.path.join(match_dir, "squads.json"), 'w', encoding='utf-8') as f:
-                json.dump(squads, f, indent=2)
-            
-            logger.info(f"Stored squads for match {match_id}")
+            if self._write_section("squads", match_id, squads):
+                logger.info("Stored squads for match %s", match_id)
+            else:
+                logger.info("Squads for match %s unchanged, skipping", match_id)
         except Exception as e:
-            logger.error(f"Failed to store squads for match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to store squads for match %s: %s", match_id, e, exc_info=True)
             raise
     
+    def _write_section(self, kind: str, match_id: str, data: Dict[str, Any]) -> bool:
+        """Atomically write a match's <kind>.json.
+        
+        Returns False without writing if the content is unchanged.
+        """
+        payload = _dumps(data)
+        digest = _digest(payload)
+        
+        match_dir = self._get_match_dir(match_id)
+        path = os.path.join(match_dir, f"{kind}.json")
+        
+        # After a restart, compare against what's already on disk
+        last = self._last_hash[kind].get(match_id)
+        if last is None:
+            try:
+                with open(path, 'rb') as f:
+                    last = _digest(f.read())
+            except FileNotFoundError:
+                pass
+        
+        if last != digest:
+            # Create match directory if it doesn't exist
+            os.makedirs(match_dir, exist_ok=True)
+            _atomic_write_bytes(path, payload)
+        
+        self._last_hash[kind][match_id] = digest
+        return last != digest
+    
     def store_live_data(self, match_id: str, live_data: Dict[str, Any]):
         """Store live data"""
         try:
-            match_dir = self._get_match_dir(match_id)
-            live_dir = os.path.join(match_dir, "live")
-            
-            # Create live directory if it doesn't exist
-            os.makedirs(live_dir, exist_ok=True)
-            
-            # Generate timestamp for the live data file
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            
-            # Write live data to file
-            with open(os.path.join(live_dir, f"{timestamp}.json"), 'w', encoding='utf-8') as f:
-                json.dump(live_data, f, indent=2)
-            
-            # Also write to latest.json for easy access
-            with open(os.path.join(live_dir, "latest.json"), 'w', encoding='utf-8') as f:
-                json.dump(live_data, f, indent=2)
-            
-            logger.info(f"Stored live data for match {match_id}")
+            stored = self._append_snapshot("live", match_id, live_data)
+            
+            # This runs on every live scrape, keep it out of the default log level
+            if logger.isEnabledFor(logging.DEBUG):
+                if stored:
+                    logger.debug("Stored live data for match %s", match_id)
+                else:
+                    logger.debug("Live data for match %s unchanged, skipping", match_id)
         except Exception as e:
-            logger.error(f"Failed to store live data for match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to store live data for match %s: %s", match_id, e, exc_info=True)
             raise
     
     def store_scorecard(self, match_id: str, scorecard: Dict[str, Any]):
         """Store scorecard"""
         try:
-            match_dir = self._get_match_dir(match_id)
-            scorecard_dir = os.path.join(match_dir, "scorecard")
-            
-            # Create scorecard directory if it doesn't exist
-            os.makedirs(scorecard_dir, exist_ok=True)
-            
-            # Generate timestamp for the scorecard file
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            
-            # Write scorecard to file
-            with open(os.path.join(scorecard_dir, f"{timestamp}.json"), 'w', encoding='utf-8') as f:
-                json.dump(scorecard, f, indent=2)
-            
-            # Also write to latest.json for easy access
-            with open(os.path.join(scorecard_dir, "latest.json"), 'w', encoding='utf-8') as f:
-                json.dump(scorecard, f, indent=2)
+            if self._append_snapshot("scorecard", match_id, scorecard):
+                logger.info("Stored scorecard for match %s", match_id)
+            else:
+                logger.info("Scorecard for match %s unchanged, skipping", match_id)
+        except Exception as e:
+            logger.error("Failed to store scorecard for match %s: %s", match_id, e, exc_info=True)
+            raise
+    
+    def store_tick(self, match_id: str, sections: Dict[str, Dict[str, Any]]):
+        """Store the sections ("live", "scorecard") scraped in one tracking tick under a shared timestamp"""
+        try:
+            timestamp = _snapshot_timestamp()
+            stored = [kind for kind, data in sections.items() if self._append_snapshot(kind, match_id, data, timestamp)]
             
-            logger.info(f"Stored scorecard for match {match_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored %s for match %s", ", ".join(stored) or "nothing new", match_id)
+        except Exception as e:
+            logger.error("Failed to store tick for match %s: %s", match_id, e, exc_info=True)
+            raise
+    
+    def _append_snapshot(self, kind: str, match_id: str, data: Dict[str, Any], timestamp: Optional[str] = None) -> bool:
+        """Append a timestamped snapshot to the match's NDJSON log for kind.
+        
+        Returns False without writing if it's identical to the last snapshot.
+        """
+        # Serialize once, the same bytes are hashed and written
+        payload = _dumps(data, indent=False)
+        
+        match_dir = self._get_match_dir(match_id)
+        path = os.path.join(match_dir, f"{kind}.ndjson")
+        
+        # After a restart, compare against the last snapshot already in the log
+        digest = _digest(payload)
+        last = self._last_hash[kind].get(match_id)
+        if last is None:
+            last_data = _read_last_record(path)
+            if last_data is not None:
+                last = _digest(_dumps(last_data, indent=False))
+        
+        # Skip the write if nothing changed since the last snapshot
+        if last == digest:
+            self._last_hash[kind][match_id] = digest
+            return False
+        
+        # Create match directory if it doesn't exist
+        os.makedirs(match_dir, exist_ok=True)
+        
+        # One {"timestamp", "data"} line per snapshot, written with a single append
+        record = b'{"timestamp":"' + (timestamp or _snapshot_timestamp()).encode() + b'","data":' + payload + b'}\n'
+        with open(path, 'ab') as f:
+            f.write(record)
+        
+        self._last_hash[kind][match_id] = digest
+        return True
+    
+    def store_scheduler_status(self, status: Dict[str, Any]):
+        """Store scheduler status so processes other than the scraper can read it"""
+        try:
+            _atomic_write_json(self.status_file, status)
         except Exception as e:
-            logger.error(f"Failed to store scorecard for match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to store scheduler status: %s", e, exc_info=True)
             raise
     
+    def get_scheduler_status(self) -> Dict[str, Any]:
+        """Get the last stored scheduler status"""
+        try:
+            return _read_json_or_none(self.status_file) or {}
+        except Exception as e:
+            logger.error("Failed to get scheduler status: %s", e, exc_info=True)
+            return {}
+    
     def _get_match_dir(self, match_id: str) -> str:
         """Get match directory path"""
         return os.path.join(self.base_dir, "matches", match_id)
     
+    def _get_match_files(self, match_id: str) -> Dict[str, str]:
+        """Get paths of the files that make up a match's data, keyed by section"""
+        match_dir = self._get_match_dir(match_id)
+        return {
+            "info": os.path.join(match_dir, "info.json"),
+            "squads": os.path.join(match_dir, "squads.json"),
+            "live": os.path.join(match_dir, "live.ndjson"),
+            "scorecard": os.path.join(match_dir, "scorecard.ndjson")
+        }
+    
     def get_match_data(self, match_id: str) -> Dict[str, Any]:
         """Get match data"""
         try:
-            match_dir = self._get_match_dir(match_id)
-            
-            result = {}
-            
-            # Read match info
-            try:
-                with open(os.path.join(match_dir, "info.json"), 'r', encoding='utf-8') as f:
-                    result['info'] = json.load(f)
-            except FileNotFoundError:
-                result['info'] = None
-            
-            # Read squads
-            try:
-                with open(os.path.join(match_dir, "squads.json"), 'r', encoding='utf-8') as f:
-                    result['squads'] = json.load(f)
-            except FileNotFoundError:
-                result['squads'] = None
-            
-            # Try to read latest live data if available
-            try:
-                with open(os.path.join(match_dir, "live", "latest.json"), 'r', encoding='utf-8') as f:
-                    result['live'] = json.load(f)
-            except FileNotFoundError:
-                result['live'] = None
-            
-            # Try to read latest scorecard if available
-            try:
-                with open(os.path.join(match_dir, "scorecard", "latest.json"), 'r', encoding='utf-8') as f:
-                    result['scorecard'] = json.load(f)
-            except FileNotFoundError:
-                result['scorecard'] = None
+            # Read all sections concurrently, missing ones come back as None.
+            # Live data and scorecards are logs, only their last record is read.
+            futures = {
+                section: _IO_POOL.submit(_load_section, path)
+                for section, path in self._get_match_files(match_id).items()
+            }
             
-            return result
+            return {section: future.result() for section, future in futures.items()}
         except Exception as e:
-            logger.error(f"Failed to get data for match {match_id}: {str(e)}", exc_info=True)
+            logger.error("Failed to get data for match %s: %s", match_id, e, exc_info=True)
             return {}
     
+    def get_match_list_version(self) -> str:
+        """Get a version tag for the match list from its inode, mtime and size without reading it"""
+        version = _file_version(self.match_list_file)
+        if version is None:
+            return "0"
+        return ".".join(map(str, version))
+    
+    def get_match_data_version(self, match_id: str) -> str:
+        """Get a version tag for a match's data from its file mtimes and sizes without reading them"""
+        # Size is included as in _load_section_cached's key, so two writes within the
+        # filesystem's mtime resolution still change the tag
+        versions = []
+        for path in self._get_match_files(match_id).values():
+            try:
+                st = os.stat(path)
+                versions.append(f"{st.st_mtime_ns}.{st.st_size}")
+            except FileNotFoundError:
+                versions.append("0")
+        return "-".join(versions)
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
+        cached_at, cached_stats = self._stats_cache
+        if cached_stats is not None and time.monotonic() - cached_at < self._stats_ttl:
+            return cached_stats
+        
         try:
-            # Get match list
-            matches = self.get_match_list()
-            
             # Count matches by status
-            status_counts = {
-                "UPCOMING": 0,
-                "LIVE": 0,
-                "COMPLETED": 0
-            }
-            
-            for match in matches:
-                status = match.get('status', 'UNKNOWN')
-                if status in status_counts:
-                    status_counts[status] += 1
+            total_matches, status_counts = self._get_status_counts()
             
             # Calculate total storage used
             total_size = 0
             
-            # Function to calculate directory size recursively
-            def get_dir_size(path):
-                total = 0
-                for entry in os.scandir(path):
-                    if entry.is_file():
-                        total += entry.stat().st_size
-                    elif entry.is_dir():
-                        total += get_dir_size(entry.path)
-                return total
-            
             # Calculate size of data directory
             if os.path.exists(self.base_dir):
-                total_size = get_dir_size(self.base_dir)
+                total_size = self._get_storage_size()
             
-            return {
-                "total_matches": len(matches),
+            stats = {
+                "total_matches": total_matches,
                 "matches_by_status": status_counts,
                 "total_storage_bytes": total_size,
                 "total_storage_mb": round(total_size / (1024 * 1024), 2),
                 "last_updated": datetime.now().isoformat()
             }
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
         except Exception as e:
-            logger.error(f"Failed to get storage statistics: {str(e)}", exc_info=True)
-            return {}
\ No newline at end of file
+            logger.error("Failed to get storage statistics: %s", e, exc_info=True)
+            return {}
+    
+    def _get_status_counts(self) -> tuple:
+        """Get match counts, only scanning the match list if it changed since they were computed"""
+        version = _file_version(self.match_list_file)
+        if version is None:
+            return _count_statuses([])
+        
+        counts_version, total, counts = self._status_counts
+        if counts_version != version:
+            # Written by another process (or first call), fall back to a full scan
+            total, counts = _count_statuses(self.iter_match_statuses())
+            self._status_counts = (version, total, counts)
+        return total, dict(counts)
+    
+    def _get_storage_size(self) -> int:
+        """Calculate size of the data directory, walking match directories in parallel"""
+        total = 0
+        futures = []
+        matches_dir = os.path.join(self.base_dir, "matches")
+        
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    total += _entry_size(entry)
+                elif entry.path != matches_dir:
+                    futures.append(_IO_POOL.submit(_get_dir_size, entry.path))
+        
+        if os.path.isdir(matches_dir):
+            with os.scandir(matches_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        futures.append(_IO_POOL.submit(_get_dir_size, entry.path))
+                    else:
+                        total += _entry_size(entry)
+        
+        return total + sum(future.result() for future in futures)
\ No newline at end of file
@@ -0,0 +1,233 @@
+import os
+import logging
+import queue
+import shutil
+import threading
+import time
+from functools import lru_cache
+import urllib3
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote import utils as remote_utils
+from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Parse chromedriver responses (extracted scorecards can run to tens of KB) with orjson;
+# its JSONDecodeError is a ValueError, which is what Selenium catches for non-JSON bodies
+if orjson is not None:
+    remote_utils.load_json = orjson.loads
+
+# Connections each driver keeps open to chromedriver (urllib3 defaults to 1)
+HTTP_POOL_SIZE = 10
+
+# How often WebDriverWait re-checks its condition (Selenium's default is 0.5 s)
+WAIT_POLL_FREQUENCY = 0.1  # seconds
+
+# Smallest /dev/shm Chrome is trusted to use for shared memory
+MIN_SHM_SIZE = 512 * 1024 * 1024
+
+# Web fonts the scrapers never need, since they only read text from the DOM
+BLOCKED_URLS = ["*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+# lru_cache alone lets threads that miss at the same time each run the install
+_chromedriver_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _resolve_chromedriver() -> str:
+    """Find or download the chromedriver binary"""
+    # A pinned binary (e.g. baked into the image) skips webdriver-manager's version check
+    return os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+
+def chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    with _chromedriver_lock:
+        return _resolve_chromedriver()
+
+def _shm_is_large() -> bool:
+    """Check whether /dev/shm has room for Chrome's shared memory"""
+    try:
+        return shutil.disk_usage("/dev/shm").total >= MIN_SHM_SIZE
+    except OSError:
+        return False
+
+def chrome_options() -> Options:
+    """Headless Chrome options for scraping text-only pages"""
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    
+    # Only fall back to /tmp for shared memory when /dev/shm is too small (Docker's default is 64 MB)
+    if not _shm_is_large():
+        options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    
+    # Set user agent
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    
+    # Return from driver.get at DOMContentLoaded; the scrapers wait for the elements they need
+    options.page_load_strategy = "eager"
+    
+    # Skip images and background work the scrapers never look at
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-translate")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.cookies": 1
+    })
+    
+    return options
+
+def create_driver():
+    """Create a headless Chrome driver that reuses its connections to chromedriver"""
+    driver = webdriver.Chrome(
+        service=Service(chromedriver_path()),
+        options=chrome_options(),
+        keep_alive=True
+    )
+    
+    # Let the tracking thread and status checks issue commands concurrently. This swaps private
+    # RemoteConnection attributes, so keep Selenium's own connection if they change (or it's a proxy)
+    executor = driver.command_executor
+    client_config = getattr(executor, "_client_config", None)
+    if type(getattr(executor, "_conn", None)) is urllib3.PoolManager and hasattr(client_config, "timeout"):
+        executor._conn.clear()
+        executor._conn = urllib3.PoolManager(
+            maxsize=HTTP_POOL_SIZE,
+            block=False,
+            timeout=client_config.timeout
+        )
+    else:
+        logger.warning("Unrecognised Selenium RemoteConnection, keeping its default connection pool")
+    
+    # Images are already off in the options; fonts can only be dropped over CDP
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    
+    return driver
+
+class DriverPoolExhausted(Exception):
+    """Raised when every pooled driver stays borrowed for the whole acquire timeout"""
+
+class WebDriverPool:
+    """Pool of headless Chrome drivers shared by the match scrapers"""
+    
+    def __init__(self, size: int = 4, acquire_timeout: int = 60, reserved: int = 0):
+        """Initialize the pool; drivers are created lazily up to size.
+        
+        reserved of them can only be borrowed with acquire(reserved=True),
+        so ordinary borrowers can never hold the whole pool.
+        """
+        self.size = size
+        self.acquire_timeout = acquire_timeout  # seconds
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._shared_slots = threading.BoundedSemaphore(size - reserved)
+        self._shared_borrowed = set()  # ids of drivers holding one of the shared slots
+    
+    def _try_create(self):
+        """Create a driver if the pool has a free slot, otherwise return None"""
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        
+        try:
+            logger.info("Starting pooled Chrome driver")
+            return create_driver()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+    
+    def acquire(self, timeout: float = None, reserved: bool = False):
+        """Borrow a driver, creating one if the pool isn't full yet.
+        
+        Waits up to timeout seconds (acquire_timeout by default) for one to be
+        given back, then raises DriverPoolExhausted; timeout=0 doesn't wait.
+        """
+        if timeout is None:
+            timeout = self.acquire_timeout
+        deadline = time.monotonic() + timeout
+        
+        if not reserved and not self._shared_slots.acquire(timeout=timeout):
+            raise DriverPoolExhausted(f"No Chrome driver became available within {timeout}s")
+        
+        try:
+            driver = self._take(max(0, deadline - time.monotonic()))
+        except BaseException as e:
+            if not reserved:
+                self._shared_slots.release()
+            if isinstance(e, queue.Empty):
+                raise DriverPoolExhausted(f"No Chrome driver became available within {timeout}s")
+            raise
+        
+        if not reserved:
+            with self._lock:
+                self._shared_borrowed.add(id(driver))
+        return driver
+    
+    def _take(self, timeout: float):
+        """Get an idle driver or create one, waiting up to timeout seconds for one to be given back (raises queue.Empty)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        driver = self._try_create()
+        if driver is not None:
+            return driver
+        
+        # Pool is full, wait for another scraper to give one back
+        return self._idle.get(timeout=timeout)
+    
+    def _give_back_slot(self, driver):
+        """Free the shared slot a returned driver was borrowed with, if any"""
+        with self._lock:
+            shared = id(driver) in self._shared_borrowed
+            self._shared_borrowed.discard(id(driver))
+        if shared:
+            self._shared_slots.release()
+    
+    def release(self, driver):
+        """Return a driver to the pool, discarding it if its session is gone"""
+        try:
+            # Unload the match page so its scripts stop running while the driver sits idle
+            driver.get("about:blank")
+            driver.delete_all_cookies()
+        except WebDriverException as e:
+            logger.warning(f"Discarding broken Chrome driver: {str(e)}")
+            self.discard(driver)
+            return
+        self._idle.put(driver)
+        self._give_back_slot(driver)
+    
+    def discard(self, driver):
+        """Quit a driver and free its slot in the pool"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting Chrome driver: {str(e)}")
+        with self._lock:
+            self._created -= 1
+        self._give_back_slot(driver)
+    
+    def close(self):
+        """Quit all idle drivers"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(driver)
\ No newline at end of file
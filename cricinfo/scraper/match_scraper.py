@@ -1,129 +1,483 @@
+import asyncio
+import json
 import logging
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from typing import Dict, List
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from scraper.data_store import DataStore
+from scraper.async_scraper import AsyncMatchScraper
+from scraper.driver_pool import WAIT_POLL_FREQUENCY, DriverPoolExhausted, WebDriverPool
+from scraper.tracking_loop import TrackingLoop
 
 logger = logging.getLogger(__name__)
 
+# Writes tick data to the store while the scraper carries on with the page
+_STORE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ms-store")
+
+# Tab elements (li or div with a tab-like class), in document order
+TAB_SELECTOR = ", ".join(
+    f"{tag}[class*='{cls}']"
+    for tag in ("li", "div")
+    for cls in ("tab", "nav-item", "MuiTab-root", "nav-link")
+)
+
+# Clicks the first tab whose rendered text contains text unless it's already selected
+# (covers "active", "selected" and MUI's "Mui-selected"). Returns "clicked", "active",
+# or null if there is no such tab.
+CLICK_TAB_JS = """
+(selector, text) => {
+    const tab = Array.from(document.querySelectorAll(selector))
+        .find(tab => tab.innerText.toLowerCase().includes(text));
+    if (!tab) return null;
+    const classes = tab.getAttribute('class') || '';
+    if (classes.includes('active') || classes.includes('selected')) return 'active';
+    tab.click();
+    return 'clicked';
+}
+"""
+
+def _click_tab_expression(tab_text: str) -> str:
+    """CDP expression running CLICK_TAB_JS for one tab"""
+    return f"({CLICK_TAB_JS})({json.dumps(TAB_SELECTOR)}, {json.dumps(tab_text.lower())})"
+
+# Built once for the tabs the scraper switches to, rather than on every click
+CLICK_TAB_EXPRESSIONS = {tab_text: _click_tab_expression(tab_text) for tab_text in ("Info", "Squad", "Live", "Scorecard")}
+
+# Row helpers: textByClass maps each class name to the text of the first descendant
+# carrying it, in one DOM walk, so a row's fields don't each need their own querySelector
+ROW_HELPERS_JS = """
+const textByClass = (el) => {
+    const found = Object.create(null);
+    for (const node of el.getElementsByTagName('*')) {
+        for (const cls of node.classList) {
+            if (!(cls in found)) found[cls] = node.textContent?.trim() || '';
+        }
+    }
+    return found;
+};
+
+// Rows whose cells are direct children in the expected column order are read by
+// index, anything else falls back to the descendant walk
+const rowCells = (row, cols) => {
+    const cells = row.children;
+    if (cells.length !== cols.length) return textByClass(row);
+    const found = Object.create(null);
+    for (let i = 0; i < cols.length; i++) {
+        if (!cells[i].classList.contains(cols[i])) return textByClass(row);
+        found[cols[i]] = cells[i].textContent?.trim() || '';
+    }
+    return found;
+};
+
+const BATSMAN_COLS = ['batsman-name', 'batsman-runs', 'batsman-balls', 'batsman-fours', 'batsman-sixes', 'batsman-strike-rate'];
+const SCORECARD_BATSMAN_COLS = ['batsman-name', 'batsman-dismissal', 'batsman-runs', 'batsman-balls', 'batsman-fours', 'batsman-sixes', 'batsman-strike-rate'];
+const BOWLER_COLS = ['bowler-name', 'bowler-overs', 'bowler-maidens', 'bowler-runs', 'bowler-wickets', 'bowler-economy'];
+"""
+
+# Page extractors; live data, scorecard and match status also make up the fused per-tick extraction
+MATCH_INFO_JS = """
+() => {
+    // Try to find a container with info in the class name
+    const infoContainer = document.querySelector('[class*="info"]');
+    if (!infoContainer) return null;
+    // Try to extract key info generically
+    const getText = sel => document.querySelector(sel)?.textContent?.trim() || '';
+    return {
+        teams: {
+            home: getText('.team-home, .teamA, .team1, .team-left'),
+            away: getText('.team-away, .teamB, .team2, .team-right')
+        },
+        matchDetails: {
+            series: getText('.series-name, .series'),
+            format: getText('.match-format, .format'),
+            venue: getText('.venue-name, .venue'),
+            date: getText('.match-date, .date'),
+            time: getText('.match-time, .time'),
+            toss: getText('.toss-result, .toss'),
+            umpires: Array.from(document.querySelectorAll('.umpire, .umpires')).map(el => el.textContent?.trim() || "")
+        }
+    };
+}
+"""
+
+SQUADS_JS = """
+() => {
+    const squadsContainer = document.querySelector('[class*="squad"]');
+    if (!squadsContainer) return null;
+    // Function to extract players from a team container
+    const extractPlayers = (teamSelector) => {
+        const players = squadsContainer.querySelectorAll(`${teamSelector} .player, ${teamSelector} .player-row, ${teamSelector} .player-item`);
+        return Array.from(players).map(player => {
+            return {
+                name: player.querySelector(".player-name")?.textContent?.trim() || player.textContent?.trim() || "",
+                role: player.querySelector(".player-role")?.textContent?.trim() || "",
+                isCaptain: !!player.querySelector(".captain-indicator, .captain"),
+                isWicketkeeper: !!player.querySelector(".wicketkeeper-indicator, .wicketkeeper")
+            };
+        });
+    };
+    return {
+        homeTeam: {
+            name: squadsContainer.querySelector(".home-team-name, .teamA, .team1, .team-left")?.textContent?.trim() || "",
+            players: extractPlayers(".home-team-squad, .teamA, .team1, .team-left")
+        },
+        awayTeam: {
+            name: squadsContainer.querySelector(".away-team-name, .teamB, .team2, .team-right")?.textContent?.trim() || "",
+            players: extractPlayers(".away-team-squad, .teamB, .team2, .team-right")
+        }
+    };
+}
+"""
+
+LIVE_DATA_JS = """
+() => {
+""" + ROW_HELPERS_JS + """
+    const liveContainer = document.querySelector('[class*="live"]');
+    if (!liveContainer) return null;
+    const getText = sel => liveContainer.querySelector(sel)?.textContent?.trim() || '';
+    return {
+        currentInnings: getText('.current-innings'),
+        score: getText('.current-score, .score'),
+        runRate: getText('.run-rate'),
+        requiredRunRate: getText('.required-run-rate'),
+        lastWicket: getText('.last-wicket'),
+        recentBalls: Array.from(liveContainer.querySelectorAll('.recent-ball')).map(el => el.textContent?.trim() || ''),
+        partnership: getText('.current-partnership'),
+        batsmen: Array.from(liveContainer.querySelectorAll('.batsman, .batsman-row')).map(el => {
+            const t = rowCells(el, BATSMAN_COLS);
+            return {
+                name: t['batsman-name'] || el.textContent?.trim() || '',
+                runs: t['batsman-runs'] || '',
+                balls: t['batsman-balls'] || '',
+                fours: t['batsman-fours'] || '',
+                sixes: t['batsman-sixes'] || '',
+                strikeRate: t['batsman-strike-rate'] || ''
+            };
+        }),
+        bowlers: Array.from(liveContainer.querySelectorAll('.bowler, .bowler-row')).map(el => {
+            const t = rowCells(el, BOWLER_COLS);
+            return {
+                name: t['bowler-name'] || el.textContent?.trim() || '',
+                overs: t['bowler-overs'] || '',
+                maidens: t['bowler-maidens'] || '',
+                runs: t['bowler-runs'] || '',
+                wickets: t['bowler-wickets'] || '',
+                economy: t['bowler-economy'] || ''
+            };
+        }),
+        matchStatus: getText('.match-status, .status'),
+        commentary: Array.from(liveContainer.querySelectorAll('.commentary-item, .commentary-row')).slice(0, 10).map(el => {
+            const t = textByClass(el);
+            return {
+                text: t['commentary-text'] || el.textContent?.trim() || '',
+                over: t['commentary-over'] || '',
+                timestamp: t['commentary-timestamp'] || ''
+            };
+        })
+    };
+}
+"""
+
+SCORECARD_JS = """
+() => {
+""" + ROW_HELPERS_JS + """
+    const scorecardContainer = document.querySelector('[class*="scorecard"]');
+    if (!scorecardContainer) return null;
+    const extractInnings = (inningsSelector) => {
+        const inningsElement = scorecardContainer.querySelector(inningsSelector);
+        if (!inningsElement) return null;
+        return {
+            team: inningsElement.querySelector('.innings-team')?.textContent?.trim() || '',
+            totalScore: inningsElement.querySelector('.innings-total')?.textContent?.trim() || '',
+            overs: inningsElement.querySelector('.innings-overs')?.textContent?.trim() || '',
+            extras: inningsElement.querySelector('.innings-extras')?.textContent?.trim() || '',
+            batsmen: Array.from(inningsElement.querySelectorAll('.batsman-row')).map(row => {
+                const t = rowCells(row, SCORECARD_BATSMAN_COLS);
+                return {
+                    name: t['batsman-name'] || row.textContent?.trim() || '',
+                    dismissal: t['batsman-dismissal'] || '',
+                    runs: t['batsman-runs'] || '',
+                    balls: t['batsman-balls'] || '',
+                    fours: t['batsman-fours'] || '',
+                    sixes: t['batsman-sixes'] || '',
+                    strikeRate: t['batsman-strike-rate'] || ''
+                };
+            }),
+            bowlers: Array.from(inningsElement.querySelectorAll('.bowler-row')).map(row => {
+                const t = rowCells(row, BOWLER_COLS);
+                return {
+                    name: t['bowler-name'] || row.textContent?.trim() || '',
+                    overs: t['bowler-overs'] || '',
+                    maidens: t['bowler-maidens'] || '',
+                    runs: t['bowler-runs'] || '',
+                    wickets: t['bowler-wickets'] || '',
+                    economy: t['bowler-economy'] || ''
+                };
+            }),
+            fallOfWickets: Array.from(inningsElement.querySelectorAll('.fow-item')).map(
+                item => item.textContent?.trim() || ''
+            )
+        };
+    };
+    const innings = [];
+    for (let i = 1; i <= 4; i++) {
+        const inningsData = extractInnings(`.innings-${i}`);
+        if (inningsData) {
+            innings.push(inningsData);
+        }
+    }
+    return {
+        innings,
+        matchSummary: scorecardContainer.querySelector('.match-summary')?.textContent?.trim() || '',
+        playerOfTheMatch: scorecardContainer.querySelector('.player-of-match')?.textContent?.trim() || ''
+    };
+}
+"""
+
+MATCH_ENDED_JS = """
+() => {
+    const statusElement = document.querySelector(".match-status");
+    if (!statusElement) return false;
+    
+    const status = statusElement.textContent?.trim().toLowerCase() || "";
+    return (
+        status.includes("match ended") ||
+        status.includes("completed") ||
+        status.includes("won by") ||
+        status.includes("drawn")
+    );
+}
+"""
+
+# Scripts for execute_script, built once rather than on every call
+MATCH_INFO_SCRIPT = f"return ({MATCH_INFO_JS})();"
+SQUADS_SCRIPT = f"return ({SQUADS_JS})();"
+LIVE_DATA_SCRIPT = f"return ({LIVE_DATA_JS})();"
+SCORECARD_SCRIPT = f"return ({SCORECARD_JS})();"
+MATCH_ENDED_SCRIPT = f"return ({MATCH_ENDED_JS})();"
+
+# Installs window.__cricExtractAll, which runs every extractor in one round trip.
+# Lists of row objects come back packed as {"$cols": keys, "$rows": values} so
+# batsmen, bowlers and commentary don't repeat their keys on every row.
+# A MutationObserver sets window.__cricDirty whenever the page changes, so a tick
+# can tell that nothing was delivered since the last extraction without running it.
+EXTRACT_ALL_JS = f"""
+(() => {{
+    const pack = (value) => {{
+        if (Array.isArray(value)) {{
+            if (value.length && value[0] && typeof value[0] === 'object' && !Array.isArray(value[0])) {{
+                const cols = Object.keys(value[0]);
+                return {{'$cols': cols, '$rows': value.map(row => cols.map(col => pack(row[col])))}};
+            }}
+            return value.map(pack);
+        }}
+        if (value && typeof value === 'object') {{
+            const packed = {{}};
+            for (const key of Object.keys(value)) packed[key] = pack(value[key]);
+            return packed;
+        }}
+        return value;
+    }};
+    window.__cricDirty = true;
+    new MutationObserver(() => {{ window.__cricDirty = true; }}).observe(document.documentElement, {{
+        childList: true,
+        subtree: true,
+        characterData: true
+    }});
+    window.__cricExtractAll = () => {{
+        window.__cricDirty = false;
+        return pack({{
+            live: ({LIVE_DATA_JS})(),
+            scorecard: ({SCORECARD_JS})(),
+            ended: ({MATCH_ENDED_JS})()
+        }});
+    }};
+}})();
+"""
+
+# Per-tick CDP expressions; the first returns false while the page is unchanged and
+# the second runs right after (re)installing the extractor
+EXTRACT_ALL_EXPRESSION = "window.__cricExtractAll ? (window.__cricDirty && window.__cricExtractAll()) : null"
+EXTRACT_ALL_RETRY_EXPRESSION = "window.__cricExtractAll()"
+
+# Makes the next tick extract again even if the page hasn't changed, after its data failed to store
+MARK_DIRTY_EXPRESSION = "window.__cricDirty = true"
+
+def _unpack(value):
+    """Rebuild the row lists packed by EXTRACT_ALL_JS"""
+    if isinstance(value, dict):
+        if "$cols" in value:
+            cols = value["$cols"]
+            return [dict(zip(cols, map(_unpack, row))) for row in value["$rows"]]
+        return {key: _unpack(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_unpack(item) for item in value]
+    return value
+
 class MatchScraper:
     """Scraper for individual cricket matches"""
     
-    def __init__(self, match_id: str, match_url: str, data_store: DataStore):
-        """Initialize the match scraper"""
+    def __init__(self, match_id: str, match_url: str, data_store: DataStore, pool: WebDriverPool, tracker: TrackingLoop, needs_js: bool = True):
+        """Initialize the match scraper.
+        
+        With needs_js=False match pages are fetched over plain HTTP and
+        parsed with selectolax, and Chrome is never started.
+        """
         self.match_id = match_id
         self.match_url = match_url
         self.data_store = data_store
+        self.needs_js = needs_js
+        self.pool = pool
+        self.tracker = tracker
         self.driver = None
         self.is_tracking = False
-        self.tracking_thread = None
+        self.tracking_task = None
         self.stop_event = threading.Event()
-        self.retry_count = 0
+        self._driver_lock = threading.Lock()  # Hands the driver over between a starting tick and stop()
+        self._wake = None  # asyncio.Event, created on the tracking loop
+        self.match_ended = False
         self.max_retries = 3
         self.retry_delay = 5  # seconds
+        self.poll_interval = 10  # seconds
+        self.max_poll_interval = 60  # seconds
+        self.last_score = None
+        self._last_sections = {}  # Last live data and scorecard handed to the store
     
     def initialize(self):
         """Initialize the match scraper"""
-        try:
-            logger.info(f"Initializing scraper for match {self.match_id}")
-            
-            # Configure Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            # Set user agent
-            chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            # Initialize Chrome driver
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            
-            # Navigate to match page
-            self.driver.get(self.match_url)
-            
-            # Wait for page to load
-            time.sleep(5)
-            
-            # Scrape initial match info and squads
-            self.scrape_match_info()
-            self.scrape_squads()
-            
-            logger.info(f"Scraper initialized for match {self.match_id}")
+        if not self.needs_js:
+            if not MatchScraper.initialize_browserless([self])[self.match_id]:
+                raise Exception(f"Failed to scrape match page for {self.match_id}")
+            return
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                logger.info(f"Initializing scraper for match {self.match_id}")
+                
+                # Don't wait for a driver: this runs inside the scheduler's status check, which
+                # retries the start on its next run rather than stalling every other match
+                self._start_driver(acquire_timeout=0)
+                
+                # Scrape initial match info and squads
+                self.scrape_match_info()
+                self.scrape_squads()
+                
+                logger.info(f"Scraper initialized for match {self.match_id}")
+                return
             
-        except Exception as e:
-            logger.error(f"Failed to initialize scraper for match {self.match_id}: {str(e)}", exc_info=True)
+            except DriverPoolExhausted:
+                raise
             
-            # Retry initialization if not exceeded max retries
-            if self.retry_count < self.max_retries:
-                self.retry_count += 1
-                logger.info(f"Retrying initialization for match {self.match_id} ({self.retry_count}/{self.max_retries})")
+            except Exception as e:
+                logger.error(f"Failed to initialize scraper for match {self.match_id}: {str(e)}", exc_info=True)
                 
-                # Wait before retrying
-                time.sleep(self.retry_delay)
-                self.initialize()
-            else:
-                raise
+                # Drop the driver from the failed attempt so a retry starts clean
+                with self._driver_lock:
+                    driver, self.driver = self.driver, None
+                if driver:
+                    self.pool.discard(driver)
+                
+                # Retry initialization if not exceeded max retries
+                if attempt == self.max_retries:
+                    raise
+                logger.info(f"Retrying initialization for match {self.match_id} ({attempt + 1}/{self.max_retries})")
+                
+                # Back off exponentially before retrying, giving up early if the scraper is stopped
+                if self.stop_event.wait(self.retry_delay * 2 ** attempt):
+                    raise Exception(f"Scraper for match {self.match_id} stopped during initialization")
+    
+    @staticmethod
+    def initialize_browserless(scrapers: List["MatchScraper"]) -> Dict[str, bool]:
+        """Initialize browserless scrapers together, returning success per match id.
+        
+        Their match pages are fetched concurrently over one keep-alive session,
+        each retried with backoff like the Selenium path.
+        """
+        if not scrapers:
+            return {}
+        for scraper in scrapers:
+            logger.info(f"Initializing browserless scraper for match {scraper.match_id}")
+        
+        first = scrapers[0]
+        results = AsyncMatchScraper(first.data_store).scrape_matches(
+            [(scraper.match_id, scraper.match_url) for scraper in scrapers],
+            retries=first.max_retries,
+            retry_delay=first.retry_delay
+        )
+        for match_id, success in results.items():
+            if success:
+                logger.info(f"Scraper initialized for match {match_id}")
+        return results
+    
+    def _start_driver(self, acquire_timeout: float = None):
+        """Borrow a Chrome driver from the pool and open the match page"""
+        # Reuse the driver if we already hold one
+        if not self.driver:
+            self._acquire_driver(acquire_timeout)
+        
+        # Navigate to match page
+        self.driver.get(self.match_url)
+        
+        # Wait until the match content has rendered
+        WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='info'], [class*='match']"))
+        )
+    
+    def _acquire_driver(self, timeout: float = None):
+        """Borrow a driver from the pool, giving it straight back if the scraper was stopped meanwhile"""
+        if self.stop_event.is_set():
+            raise Exception(f"Scraper for match {self.match_id} is stopped")
+        driver = self.pool.acquire(timeout=timeout)
+        
+        # stop() only returns the driver it finds in self.driver, so check and set together
+        with self._driver_lock:
+            if not self.stop_event.is_set():
+                self.driver = driver
+                return
+        self.pool.release(driver)
+        raise Exception(f"Scraper for match {self.match_id} was stopped while waiting for a driver")
     
     def _click_tab_by_text(self, tab_text: str, wait_selector: str = None):
         """Click a tab by its visible text and wait for content to load."""
         try:
-            # Find all tab elements (li or div with role="tab" or similar)
-            tabs = self.driver.find_elements(By.XPATH, "//li[contains(@class, 'tab') or contains(@class, 'nav-item') or contains(@class, 'MuiTab-root') or contains(@class, 'tab-item') or contains(@class, 'tab-link') or contains(@class, 'nav-link') or contains(@class, 'tab')] | //div[contains(@class, 'tab') or contains(@class, 'nav-item') or contains(@class, 'MuiTab-root') or contains(@class, 'tab-item') or contains(@class, 'tab-link') or contains(@class, 'nav-link') or contains(@class, 'tab')]")
-            for tab in tabs:
-                if tab_text.lower() in tab.text.lower() and 'active' not in tab.get_attribute('class'):
-                    tab.click()
-                    if wait_selector:
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
-                        )
-                    time.sleep(1)
-                    return True
-            return False
+            # Find the tab, check whether it's selected and click it in a single round trip
+            state = self._evaluate(CLICK_TAB_EXPRESSIONS.get(tab_text) or _click_tab_expression(tab_text))
+            if state is None:
+                return False
+            
+            # An already active tab is showing its content, so there's nothing to wait for
+            if state == "clicked" and wait_selector:
+                WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            return True
         except Exception as e:
             logger.warning(f"Could not click tab '{tab_text}': {e}")
             return False
-
+    
+    def _extract_from_tab(self, tab_text: str, wait_selector: str, script: str, known_missing: bool = False):
+        """Run an extraction script, switching to its tab only if the pane isn't in the DOM yet.
+        
+        known_missing skips the first attempt when the caller already saw the pane missing.
+        """
+        # Most pages keep hidden tab panes in the DOM, so try without clicking first
+        result = None if known_missing else self.driver.execute_script(script)
+        if result is None:
+            self._click_tab_by_text(tab_text, wait_selector=wait_selector)
+            result = self.driver.execute_script(script)
+        return result
+    
     def scrape_match_info(self):
         """Scrape match information"""
         try:
             logger.info(f"Scraping match info for {self.match_id}")
-            self._click_tab_by_text("Info", wait_selector="[class*='info']")
             # Extract match information using JavaScript
-            match_info = self.driver.execute_script("""
-                // Try to find a container with info in the class name
-                const infoContainer = document.querySelector('[class*="info"]');
-                if (!infoContainer) return null;
-                // Try to extract key info generically
-                const getText = sel => document.querySelector(sel)?.textContent?.trim() || '';
-                return {
-                    teams: {
-                        home: getText('.team-home, .teamA, .team1, .team-left'),
-                        away: getText('.team-away, .teamB, .team2, .team-right')
-                    },
-                    matchDetails: {
-                        series: getText('.series-name, .series'),
-                        format: getText('.match-format, .format'),
-                        venue: getText('.venue-name, .venue'),
-                        date: getText('.match-date, .date'),
-                        time: getText('.match-time, .time'),
-                        toss: getText('.toss-result, .toss'),
-                        umpires: Array.from(document.querySelectorAll('.umpire, .umpires')).map(el => el.textContent?.trim() || "")
-                    }
-                };
-            """)
+            match_info = self._extract_from_tab("Info", "[class*='info']", MATCH_INFO_SCRIPT)
             if not match_info:
                 raise Exception("Failed to extract match information")
             self.data_store.store_match_info(self.match_id, match_info)
@@ -136,33 +490,7 @@ class MatchScraper:
         """Scrape team squads"""
         try:
             logger.info(f"Scraping squads for {self.match_id}")
-            self._click_tab_by_text("Squad", wait_selector="[class*='squad']")
-            squads = self.driver.execute_script("""
-                const squadsContainer = document.querySelector('[class*="squad"]');
-                if (!squadsContainer) return null;
-                // Function to extract players from a team container
-                const extractPlayers = (teamSelector) => {
-                    const players = squadsContainer.querySelectorAll(`${teamSelector} .player, ${teamSelector} .player-row, ${teamSelector} .player-item`);
-                    return Array.from(players).map(player => {
-                        return {
-                            name: player.querySelector(".player-name")?.textContent?.trim() || player.textContent?.trim() || "",
-                            role: player.querySelector(".player-role")?.textContent?.trim() || "",
-                            isCaptain: !!player.querySelector(".captain-indicator, .captain"),
-                            isWicketkeeper: !!player.querySelector(".wicketkeeper-indicator, .wicketkeeper")
-                        };
-                    });
-                };
-                return {
-                    homeTeam: {
-                        name: squadsContainer.querySelector(".home-team-name, .teamA, .team1, .team-left")?.textContent?.trim() || "",
-                        players: extractPlayers(".home-team-squad, .teamA, .team1, .team-left")
-                    },
-                    awayTeam: {
-                        name: squadsContainer.querySelector(".away-team-name, .teamB, .team2, .team-right")?.textContent?.trim() || "",
-                        players: extractPlayers(".away-team-squad, .teamB, .team2, .team-right")
-                    }
-                };
-            """)
+            squads = self._extract_from_tab("Squad", "[class*='squad']", SQUADS_SCRIPT)
             if not squads:
                 raise Exception("Failed to extract squads information")
             self.data_store.store_squads(self.match_id, squads)
@@ -181,150 +509,218 @@ class MatchScraper:
             self.is_tracking = True
             self.stop_event.clear()
             
-            # Create and start tracking thread
-            self.tracking_thread = threading.Thread(target=self._live_tracking_worker)
-            self.tracking_thread.daemon = True
-            self.tracking_thread.start()
+            # Schedule tracking on the shared loop
+            self.tracking_task = self.tracker.submit(self._live_tracking_worker())
             
             logger.info(f"Live tracking started for match {self.match_id}")
-            
+        
         except Exception as e:
             self.is_tracking = False
             logger.error(f"Failed to start live tracking for match {self.match_id}: {str(e)}", exc_info=True)
             raise
     
-    def _live_tracking_worker(self):
-        """Worker function for live tracking thread"""
+    async def _live_tracking_worker(self):
+        """Live tracking coroutine, run on the shared tracking loop"""
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
         try:
-            # Initial scrape of live data and scorecard
-            self.scrape_live_data()
-            self.scrape_scorecard()
-            
-            # Continue scraping until stopped
-            while not self.stop_event.is_set():
-                try:
-                    self.scrape_live_data()
-                    self.scrape_scorecard()
-                except Exception as e:
-                    logger.error(f"Error during live tracking for match {self.match_id}: {str(e)}", exc_info=True)
-                
-                # Wait for 30 seconds before next scrape
-                self.stop_event.wait(30)
-                
+            if self.needs_js:
+                # Selenium calls run on the tracking loop's worker threads; the first tick opens the page if needed
+                await self._track(lambda: loop.run_in_executor(None, self._scrape_tick_or_recover))
+            else:
+                # Static pages are polled over one keep-alive HTTP session, no browser needed
+                http_scraper = AsyncMatchScraper(self.data_store)
+                async with http_scraper.session() as session:
+                    await self._track(lambda: self._scrape_tick_http(http_scraper, session))
+        
         except Exception as e:
             logger.error(f"Live tracking worker failed for match {self.match_id}: {str(e)}", exc_info=True)
     
-    def scrape_live_data(self):
+    async def _track(self, tick):
+        """Run tick() now and then repeatedly until the scraper is stopped or the match ends"""
+        # Poll quickly while the score moves and back off while it doesn't (breaks, rain, reviews)
+        interval = self.poll_interval
+        last_score = self.last_score
+        while True:
+            # A failed tick, including the first one, is retried on the next poll
+            try:
+                await tick()
+            except Exception as e:
+                logger.error(f"Error during live tracking for match {self.match_id}: {str(e)}", exc_info=True)
+            
+            # No point polling a finished match until the scheduler stops us
+            if self.match_ended:
+                logger.info(f"Match {self.match_id} has ended, stopping live tracking")
+                break
+            
+            if self.last_score != last_score:
+                interval = self.poll_interval
+                last_score = self.last_score
+            else:
+                interval = min(interval * 2, self.max_poll_interval)
+            
+            if await self._wait(interval):
+                break
+    
+    async def _wait(self, timeout: float) -> bool:
+        """Sleep for up to timeout seconds, returning True once the scraper is stopped"""
+        if not self.stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.stop_event.is_set()
+    
+    def _wake_up(self):
+        """Interrupt the tracking coroutine's wait (runs on the tracking loop)"""
+        if self._wake:
+            self._wake.set()
+    
+    def scrape_tick(self):
+        """Scrape live data, scorecard and match status in a single WebDriver round trip"""
+        if not self.driver:
+            return
+        
+        logger.info(f"Scraping live data and scorecard for {self.match_id}")
+        result = self._evaluate(EXTRACT_ALL_EXPRESSION)
+        
+        # Nothing on the page has changed since the last tick
+        if result is False:
+            logger.debug(f"No page updates for {self.match_id} since the last tick")
+            return
+        
+        # Install the extractor on first use or after the page was reloaded
+        if result is None:
+            self._evaluate(EXTRACT_ALL_JS)
+            result = self._evaluate(EXTRACT_ALL_RETRY_EXPRESSION)
+        result = _unpack(result)
+        
+        # Store whatever was extracted in one go, overlapping the write with any fallback scrape
+        sections = self._record_tick(result)
+        stored = _STORE_POOL.submit(self.data_store.store_tick, self.match_id, sections) if sections else None
+        
+        try:
+            # Fall back to switching tabs for any pane missing from the DOM
+            if not result["live"]:
+                self.scrape_live_data(known_missing=True)
+            if not result["scorecard"]:
+                self.scrape_scorecard(known_missing=True)
+        finally:
+            # Don't start the next tick before this one is written
+            if stored:
+                try:
+                    stored.result()
+                except Exception:
+                    # Let the next tick extract and store these sections again; the extraction
+                    # already reset the page's dirty flag, so set it back
+                    self._last_sections.clear()
+                    try:
+                        self._evaluate(MARK_DIRTY_EXPRESSION)
+                    except Exception as e:
+                        logger.warning(f"Could not mark the page for match {self.match_id} for re-extraction: {e}")
+                    raise
+    
+    def _scrape_tick_or_recover(self):
+        """Run scrape_tick, replacing the driver if its Chrome has crashed so the next tick starts clean"""
+        try:
+            # A replacement that failed to start on an earlier tick is retried here
+            if not self.driver:
+                self._start_driver()
+            self.scrape_tick()
+        except WebDriverException:
+            if not self.driver or self._driver_alive():
+                raise
+            logger.warning(f"Chrome for match {self.match_id} stopped responding, replacing its driver")
+            with self._driver_lock:
+                driver, self.driver = self.driver, None
+            if driver:
+                self.pool.discard(driver)
+            if not self.stop_event.is_set():
+                self._start_driver()
+            raise
+    
+    def _driver_alive(self) -> bool:
+        """Check whether the driver's browser session still answers"""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    async def _scrape_tick_http(self, http_scraper: AsyncMatchScraper, session):
+        """Fetch and store live data, scorecard and match status without a browser"""
+        logger.info(f"Fetching live data and scorecard for {self.match_id}")
+        result = await http_scraper.fetch_tick(session, self.match_url)
+        
+        # File I/O stays off the event loop
+        sections = self._record_tick(result)
+        if sections:
+            try:
+                await asyncio.get_running_loop().run_in_executor(_STORE_POOL, self.data_store.store_tick, self.match_id, sections)
+            except Exception:
+                self._last_sections.clear()
+                raise
+        
+        if not result["live"]:
+            raise Exception("Failed to extract live data")
+        if not result["scorecard"]:
+            raise Exception("Failed to extract scorecard data")
+    
+    def _record_tick(self, result: dict) -> dict:
+        """Note a tick's match status and score, returning the sections that changed since the last tick"""
+        self.match_ended = bool(result["ended"])
+        if result["live"]:
+            self.last_score = result["live"].get("score")
+        
+        # Most ticks between deliveries repeat the last data, which doesn't need a trip to the store
+        sections = {}
+        for kind in ("live", "scorecard"):
+            data = result[kind]
+            if data and data != self._last_sections.get(kind):
+                sections[kind] = self._last_sections[kind] = data
+        return sections
+    
+    def _evaluate(self, expression: str):
+        """Evaluate a JS expression over CDP, skipping the W3C execute_script wrapping"""
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True
+        })
+        if "exceptionDetails" in response:
+            details = response["exceptionDetails"]
+            raise Exception(details.get("exception", {}).get("description") or details.get("text"))
+        return response["result"].get("value")
+    
+    def scrape_live_data(self, known_missing: bool = False):
         """Scrape live match data"""
         if not self.driver:
             return
         
         try:
             logger.info(f"Scraping live data for {self.match_id}")
-            self._click_tab_by_text("Live", wait_selector="[class*='live']")
-            live_data = self.driver.execute_script("""
-                const liveContainer = document.querySelector('[class*="live"]');
-                if (!liveContainer) return null;
-                const getText = sel => liveContainer.querySelector(sel)?.textContent?.trim() || '';
-                return {
-                    currentInnings: getText('.current-innings'),
-                    score: getText('.current-score, .score'),
-                    runRate: getText('.run-rate'),
-                    requiredRunRate: getText('.required-run-rate'),
-                    lastWicket: getText('.last-wicket'),
-                    recentBalls: Array.from(liveContainer.querySelectorAll('.recent-ball')).map(el => el.textContent?.trim() || ''),
-                    partnership: getText('.current-partnership'),
-                    batsmen: Array.from(liveContainer.querySelectorAll('.batsman, .batsman-row')).map(el => ({
-                        name: el.querySelector('.batsman-name')?.textContent?.trim() || el.textContent?.trim() || '',
-                        runs: el.querySelector('.batsman-runs')?.textContent?.trim() || '',
-                        balls: el.querySelector('.batsman-balls')?.textContent?.trim() || '',
-                        fours: el.querySelector('.batsman-fours')?.textContent?.trim() || '',
-                        sixes: el.querySelector('.batsman-sixes')?.textContent?.trim() || '',
-                        strikeRate: el.querySelector('.batsman-strike-rate')?.textContent?.trim() || ''
-                    })),
-                    bowlers: Array.from(liveContainer.querySelectorAll('.bowler, .bowler-row')).map(el => ({
-                        name: el.querySelector('.bowler-name')?.textContent?.trim() || el.textContent?.trim() || '',
-                        overs: el.querySelector('.bowler-overs')?.textContent?.trim() || '',
-                        maidens: el.querySelector('.bowler-maidens')?.textContent?.trim() || '',
-                        runs: el.querySelector('.bowler-runs')?.textContent?.trim() || '',
-                        wickets: el.querySelector('.bowler-wickets')?.textContent?.trim() || '',
-                        economy: el.querySelector('.bowler-economy')?.textContent?.trim() || ''
-                    })),
-                    matchStatus: getText('.match-status, .status'),
-                    commentary: Array.from(liveContainer.querySelectorAll('.commentary-item, .commentary-row')).map(el => ({
-                        text: el.querySelector('.commentary-text')?.textContent?.trim() || el.textContent?.trim() || '',
-                        over: el.querySelector('.commentary-over')?.textContent?.trim() || '',
-                        timestamp: el.querySelector('.commentary-timestamp')?.textContent?.trim() || ''
-                    })).slice(0, 10)
-                };
-            """)
+            live_data = self._extract_from_tab("Live", "[class*='live']", LIVE_DATA_SCRIPT, known_missing)
             
             if not live_data:
                 raise Exception("Failed to extract live data")
             
             # Store live data in data store
             self.data_store.store_live_data(self.match_id, live_data)
+            self.last_score = live_data.get("score")
             
             logger.info(f"Successfully scraped live data for {self.match_id}")
-            
+        
         except Exception as e:
             logger.error(f"Error scraping live data for {self.match_id}: {str(e)}", exc_info=True)
             raise
     
-    def scrape_scorecard(self):
+    def scrape_scorecard(self, known_missing: bool = False):
         """Scrape scorecard data"""
         if not self.driver:
             return
         
         try:
             logger.info(f"Scraping scorecard for {self.match_id}")
-            self._click_tab_by_text("Scorecard", wait_selector="[class*='scorecard']")
-            scorecard = self.driver.execute_script("""
-                const scorecardContainer = document.querySelector('[class*="scorecard"]');
-                if (!scorecardContainer) return null;
-                const extractInnings = (inningsSelector) => {
-                    const inningsElement = scorecardContainer.querySelector(inningsSelector);
-                    if (!inningsElement) return null;
-                    return {
-                        team: inningsElement.querySelector('.innings-team')?.textContent?.trim() || '',
-                        totalScore: inningsElement.querySelector('.innings-total')?.textContent?.trim() || '',
-                        overs: inningsElement.querySelector('.innings-overs')?.textContent?.trim() || '',
-                        extras: inningsElement.querySelector('.innings-extras')?.textContent?.trim() || '',
-                        batsmen: Array.from(inningsElement.querySelectorAll('.batsman-row')).map(row => ({
-                            name: row.querySelector('.batsman-name')?.textContent?.trim() || row.textContent?.trim() || '',
-                            dismissal: row.querySelector('.batsman-dismissal')?.textContent?.trim() || '',
-                            runs: row.querySelector('.batsman-runs')?.textContent?.trim() || '',
-                            balls: row.querySelector('.batsman-balls')?.textContent?.trim() || '',
-                            fours: row.querySelector('.batsman-fours')?.textContent?.trim() || '',
-                            sixes: row.querySelector('.batsman-sixes')?.textContent?.trim() || '',
-                            strikeRate: row.querySelector('.batsman-strike-rate')?.textContent?.trim() || ''
-                        })),
-                        bowlers: Array.from(inningsElement.querySelectorAll('.bowler-row')).map(row => ({
-                            name: row.querySelector('.bowler-name')?.textContent?.trim() || row.textContent?.trim() || '',
-                            overs: row.querySelector('.bowler-overs')?.textContent?.trim() || '',
-                            maidens: row.querySelector('.bowler-maidens')?.textContent?.trim() || '',
-                            runs: row.querySelector('.bowler-runs')?.textContent?.trim() || '',
-                            wickets: row.querySelector('.bowler-wickets')?.textContent?.trim() || '',
-                            economy: row.querySelector('.bowler-economy')?.textContent?.trim() || ''
-                        })),
-                        fallOfWickets: Array.from(inningsElement.querySelectorAll('.fow-item')).map(
-                            item => item.textContent?.trim() || ''
-                        )
-                    };
-                };
-                const innings = [];
-                for (let i = 1; i <= 4; i++) {
-                    const inningsData = extractInnings(`.innings-${i}`);
-                    if (inningsData) {
-                        innings.push(inningsData);
-                    }
-                }
-                return {
-                    innings,
-                    matchSummary: scorecardContainer.querySelector('.match-summary')?.textContent?.trim() || '',
-                    playerOfTheMatch: scorecardContainer.querySelector('.player-of-match')?.textContent?.trim() || ''
-                };
-            """)
+            scorecard = self._extract_from_tab("Scorecard", "[class*='scorecard']", SCORECARD_SCRIPT, known_missing)
             
             if not scorecard:
                 raise Exception("Failed to extract scorecard data")
@@ -333,33 +729,26 @@ class MatchScraper:
             self.data_store.store_scorecard(self.match_id, scorecard)
             
             logger.info(f"Successfully scraped scorecard for {self.match_id}")
-            
+        
         except Exception as e:
             logger.error(f"Error scraping scorecard for {self.match_id}: {str(e)}", exc_info=True)
             raise
     
     def check_if_match_ended(self):
         """Check if the match has ended"""
+        # Live tracking already reads the match status on every tick
+        if self.is_tracking:
+            return self.match_ended
+        
         if not self.driver:
             return False
         
         try:
             # Check match status from the page
-            is_ended = self.driver.execute_script("""
-                const statusElement = document.querySelector(".match-status");
-                if (!statusElement) return false;
-                
-                const status = statusElement.textContent?.trim().toLowerCase() || "";
-                return (
-                    status.includes("match ended") ||
-                    status.includes("completed") ||
-                    status.includes("won by") ||
-                    status.includes("drawn")
-                );
-            """)
+            is_ended = self.driver.execute_script(MATCH_ENDED_SCRIPT)
             
             return is_ended
-            
+        
         except Exception as e:
             logger.error(f"Error checking if match {self.match_id} has ended: {str(e)}", exc_info=True)
             return False
@@ -368,18 +757,30 @@ class MatchScraper:
         """Stop the scraper"""
         logger.info(f"Stopping scraper for match {self.match_id}")
         
-        # Signal tracking thread to stop
+        # Signal tracking coroutine to stop
         self.stop_event.set()
         
-        # Wait for tracking thread to finish
-        if self.tracking_thread and self.tracking_thread.is_alive():
-            self.tracking_thread.join(timeout=5)
+        # Wait for tracking coroutine to finish its current scrape
+        finished = True
+        if self.tracking_task:
+            self.tracker.call_soon(self._wake_up)
+            try:
+                self.tracking_task.result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Live tracking for match {self.match_id} did not stop cleanly: {e!r}")
+            finished = self.tracking_task.done()
+            self.tracking_task = None
         
         self.is_tracking = False
         
-        # Close driver
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        with self._driver_lock:
+            driver, self.driver = self.driver, None
+        if driver:
+            if finished:
+                # Return driver to the pool
+                self.pool.release(driver)
+            else:
+                # A tick may still be running on it, so it can't go to another match
+                self.pool.discard(driver)
         
         logger.info(f"Scraper stopped for match {self.match_id}")
\ No newline at end of file
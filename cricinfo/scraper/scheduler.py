@@ -1,49 +1,73 @@
+import os
+import heapq
 import logging
-import time
+import threading
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 from scraper.match_scraper import MatchScraper
+from scraper.driver_pool import WAIT_POLL_FREQUENCY, DriverPoolExhausted, WebDriverPool
+from scraper.tracking_loop import TrackingLoop
 from scraper.data_store import DataStore
 from scraper.types import Match, MatchStatus
 
 logger = logging.getLogger(__name__)
 
+# Reads every match card on the fixtures page
+MATCH_LIST_SCRIPT = """
+const matchElements = document.querySelectorAll(".match-card");
+return Array.from(matchElements).map(element => {
+    const id = element.getAttribute("data-match-id") || "";
+    const teams = element.querySelector(".teams")?.textContent?.trim() || "";
+    const format = element.querySelector(".format")?.textContent?.trim() || "";
+    const dateTimeStr = element.querySelector(".date-time")?.textContent?.trim() || "";
+    const url = element.querySelector("a")?.getAttribute("href") || "";
+
+    return {
+        id,
+        teams,
+        format,
+        dateTime: dateTimeStr,
+        url,
+        status: "UPCOMING"
+    };
+});
+"""
+
 class MatchScheduler:
     """Scheduler for cricket match scraping"""
     
     def __init__(self, data_store: DataStore):
         """Initialize the match scheduler"""
         self.data_store = data_store
-        self.driver = None
         self.match_list = []
+        self.matches_by_id = {}
+        self.start_times = {}  # Parsed start time by match ID
+        self.upcoming = []  # Heap of (start time, match ID) for matches without a scraper
         self.active_scrapers = {}  # Dictionary of active scrapers
+        self._lock = threading.Lock()  # update_match_list and check_match_status run on different job threads
         self.is_running = False
+        
+        # Set SCRAPER_NEEDS_JS=0 to scrape static match pages without a browser
+        self.needs_js = os.environ.get("SCRAPER_NEEDS_JS", "1") != "0"
+        
+        # Chrome drivers shared by all match scrapers, plus one only the match list update may borrow
+        self.driver_pool = WebDriverPool(size=int(os.environ.get("SCRAPER_DRIVER_POOL_SIZE", "4")) + 1, reserved=1)
+        
+        # One event loop supervises live tracking for all matches
+        self.tracker = TrackingLoop(workers=self.driver_pool.size)
     
     def initialize(self):
         """Initialize the scheduler"""
         try:
             logger.info("Initializing scheduler")
             
-            # Configure Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            # Set user agent
-            chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            # Initialize Chrome driver
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
+            # Start a pooled Chrome driver up front; it loads the match list and then
+            # serves the first match scraper, instead of the scheduler keeping its own browser
+            self.driver_pool.release(self.driver_pool.acquire(reserved=True))
             
             self.is_running = True
             logger.info("Scheduler initialized successfully")
@@ -54,55 +78,58 @@ class MatchScheduler:
     
     def update_match_list(self):
         """Update the list of upcoming matches"""
-        if not self.driver or not self.is_running:
+        if not self.is_running:
             return
         
         try:
             logger.info("Updating match list")
             
-            # Navigate to the match list page
-            self.driver.get("https://crex.live/fixtures/match-list")
-            
-            # Wait for the page to load
-            time.sleep(5)
-            
-            # Extract match data using JavaScript
-            matches = self.driver.execute_script("""
-                const matchElements = document.querySelectorAll(".match-card");
-                return Array.from(matchElements).map(element => {
-                    const id = element.getAttribute("data-match-id") || "";
-                    const teams = element.querySelector(".teams")?.textContent?.trim() || "";
-                    const format = element.querySelector(".format")?.textContent?.trim() || "";
-                    const dateTimeStr = element.querySelector(".date-time")?.textContent?.trim() || "";
-                    const url = element.querySelector("a")?.getAttribute("href") || "";
-                    
-                    return {
-                        id,
-                        teams,
-                        format,
-                        dateTime: dateTimeStr,
-                        url,
-                        status: "UPCOMING"
-                    };
-                });
-            """)
+            # Borrow a pooled driver for the match list page; the reserved slot means one is
+            # always free or about to be, however many matches are being tracked
+            driver = self.driver_pool.acquire(reserved=True)
+            try:
+                # Navigate to the match list page
+                driver.get("https://crex.live/fixtures/match-list")
+                
+                # Extract match data using JavaScript as soon as the cards render, so the
+                # wait's last poll is the extraction (a day without fixtures has none)
+                try:
+                    matches = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                        lambda d: d.execute_script(MATCH_LIST_SCRIPT)
+                    )
+                except TimeoutException:
+                    logger.warning("No match cards found on the match list page")
+                    matches = []
+            finally:
+                self.driver_pool.release(driver)
             
             # Process match data
             processed_matches = []
+            start_times = {}
             for match in matches:
                 try:
                     # Parse date and time
                     match_datetime = datetime.strptime(match['dateTime'], "%d %b %Y, %H:%M %Z")
                     match['dateTime'] = match_datetime.isoformat()
-                    processed_matches.append(match)
+                    match['status'] = MatchStatus(match['status'])
+                    processed_matches.append(Match(**match))
+                    start_times[match['id']] = match_datetime
                 except Exception as e:
                     logger.warning(f"Failed to process match: {str(e)}")
             
-            # Update match list
-            self.match_list = processed_matches
+            # Update match list, keeping start times parsed and upcoming matches ordered by start
+            matches_by_id = {match.id: match for match in processed_matches}
+            with self._lock:
+                upcoming = [(match_time, match_id) for match_id, match_time in start_times.items()
+                            if match_id not in self.active_scrapers]
+                heapq.heapify(upcoming)
+                self.match_list = processed_matches
+                self.matches_by_id = matches_by_id
+                self.start_times = start_times
+                self.upcoming = upcoming
             
             # Store match list in data store
-            self.data_store.store_match_list(processed_matches)
+            self.data_store.store_match_list([asdict(match) for match in processed_matches])
             
             logger.info(f"Updated match list with {len(processed_matches)} matches")
             
@@ -114,50 +141,95 @@ class MatchScheduler:
         if not self.is_running:
             return
         
+        # Status transitions from this tick, written together at the end
+        status_updates = {}
+        
         try:
             now = datetime.now()
             
-            # Check each match
-            for match in self.match_list:
-                match_id = match['id']
-                match_time = datetime.fromisoformat(match['dateTime'])
+            # Take the matches about to start (within 5 minutes), earliest first, along with the
+            # index they belong to, so a match list update during a slow start can't swap them out
+            due = []
+            with self._lock:
+                upcoming = self.upcoming
+                matches_by_id = self.matches_by_id
+                start_times = self.start_times
+                while upcoming and upcoming[0][0] - now <= timedelta(minutes=5):
+                    due.append(heapq.heappop(upcoming))
+            
+            # Create a scraper for each match that still needs one
+            pending = []
+            for match_time, match_id in due:
+                match = matches_by_id.get(match_id)
+                if match is None or match_time <= now or match_id in self.active_scrapers:
+                    continue
                 
-                # If match is about to start (within 5 minutes) and no scraper is running
-                if (match_time - now <= timedelta(minutes=5) and 
-                    match_time > now and 
-                    match_id not in self.active_scrapers):
-                    
-                    logger.info(f"Match {match_id} is about to start, preparing scraper")
-                    
-                    # Create and initialize match scraper
-                    scraper = MatchScraper(match_id, match['url'], self.data_store)
-                    scraper.initialize()
-                    
-                    # Add to active scrapers
-                    self.active_scrapers[match_id] = scraper
-                    
-                    # Update match status
-                    match['status'] = MatchStatus.UPCOMING
-                    self.data_store.update_match_status(match_id, MatchStatus.UPCOMING)
+                logger.info(f"Match {match_id} is about to start, preparing scraper")
+                scraper = MatchScraper(match_id, match.url, self.data_store, self.driver_pool, self.tracker, needs_js=self.needs_js)
+                pending.append((match_time, match_id, match, scraper))
+            
+            retry = []
+            started = []
+            if self.needs_js:
+                for i, (match_time, match_id, match, scraper) in enumerate(pending):
+                    try:
+                        scraper.initialize()
+                    except DriverPoolExhausted:
+                        # Every driver is tracking a match; leave this and later matches for the next check
+                        logger.warning(f"No Chrome driver free for match {match_id}, retrying on the next check")
+                        retry.extend((entry[0], entry[1]) for entry in pending[i:])
+                        break
+                    except Exception as e:
+                        # A failed start is retried on the next check without holding up the others
+                        logger.error(f"Failed to start scraper for match {match_id}: {str(e)}", exc_info=True)
+                        retry.append((match_time, match_id))
+                        continue
+                    started.append((match_id, match, scraper))
+            elif pending:
+                # Fetch every due match page at once, concurrently over one keep-alive session
+                results = MatchScraper.initialize_browserless([scraper for _, _, _, scraper in pending])
+                for match_time, match_id, match, scraper in pending:
+                    if results[match_id]:
+                        started.append((match_id, match, scraper))
+                    else:
+                        logger.error(f"Failed to start scraper for match {match_id}, retrying on the next check")
+                        retry.append((match_time, match_id))
+            
+            for match_id, match, scraper in started:
+                # Add to active scrapers
+                self.active_scrapers[match_id] = scraper
+                
+                # Update match status
+                match.status = MatchStatus.UPCOMING
+                status_updates[match_id] = MatchStatus.UPCOMING
+            
+            # A match list update since the snapshot has already re-queued every match without a scraper
+            if retry:
+                with self._lock:
+                    if self.upcoming is upcoming:
+                        for entry in retry:
+                            heapq.heappush(upcoming, entry)
+            
+            # Only matches with a scraper can go live or end
+            for match_id, scraper in list(self.active_scrapers.items()):
+                match = matches_by_id.get(match_id)
+                if match is None:
+                    continue
+                match_time = start_times[match_id]
                 
                 # If match has started and scraper is not in LIVE mode
-                if (match_time <= now and 
-                    match_id in self.active_scrapers and 
-                    match['status'] != MatchStatus.LIVE):
-                    
+                if match_time <= now and match.status != MatchStatus.LIVE:
                     logger.info(f"Match {match_id} has started, switching to live mode")
                     
-                    # Get scraper and switch to live mode
-                    scraper = self.active_scrapers[match_id]
+                    # Switch scraper to live mode
                     scraper.start_live_tracking()
                     
                     # Update match status
-                    match['status'] = MatchStatus.LIVE
-                    self.data_store.update_match_status(match_id, MatchStatus.LIVE)
+                    match.status = MatchStatus.LIVE
+                    status_updates[match_id] = MatchStatus.LIVE
                 
                 # Check if any live match has ended
-                if match['status'] == MatchStatus.LIVE and match_id in self.active_scrapers:
-                    scraper = self.active_scrapers[match_id]
+                if match.status == MatchStatus.LIVE:
                     is_match_ended = scraper.check_if_match_ended()
                     
                     if is_match_ended:
@@ -168,11 +240,18 @@ class MatchScheduler:
                         del self.active_scrapers[match_id]
                         
                         # Update match status
-                        match['status'] = MatchStatus.COMPLETED
-                        self.data_store.update_match_status(match_id, MatchStatus.COMPLETED)
+                        match.status = MatchStatus.COMPLETED
+                        status_updates[match_id] = MatchStatus.COMPLETED
             
         except Exception as e:
             logger.error(f"Error checking match status: {str(e)}", exc_info=True)
+        
+        # Persist all transitions with a single match list write
+        if status_updates:
+            try:
+                self.data_store.bulk_update_match_statuses(status_updates)
+            except Exception as e:
+                logger.error(f"Failed to store match status updates: {str(e)}", exc_info=True)
     
     def stop(self):
         """Stop the scheduler and all active scrapers"""
@@ -185,24 +264,22 @@ class MatchScheduler:
             scraper.stop()
             del self.active_scrapers[match_id]
         
-        # Close browser
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        # Stop the tracking loop and quit the pooled drivers the scrapers gave back
+        self.tracker.close()
+        self.driver_pool.close()
         
         logger.info("Scheduler stopped")
     
     def get_status(self):
         """Get status information about the scheduler"""
-        upcoming_matches = sum(1 for m in self.match_list if m['status'] == MatchStatus.UPCOMING)
-        live_matches = sum(1 for m in self.match_list if m['status'] == MatchStatus.LIVE)
-        completed_matches = sum(1 for m in self.match_list if m['status'] == MatchStatus.COMPLETED)
+        # Count every status in a single pass over the match list
+        status_counts = Counter(m.status for m in self.match_list)
         
         return {
             "is_running": self.is_running,
             "match_count": len(self.match_list),
             "active_scrapers": list(self.active_scrapers.keys()),
-            "upcoming_matches": upcoming_matches,
-            "live_matches": live_matches,
-            "completed_matches": completed_matches
+            "upcoming_matches": status_counts[MatchStatus.UPCOMING],
+            "live_matches": status_counts[MatchStatus.LIVE],
+            "completed_matches": status_counts[MatchStatus.COMPLETED]
         }
\ No newline at end of file
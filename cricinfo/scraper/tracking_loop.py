@@ -0,0 +1,37 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class TrackingLoop:
+    """Single asyncio event loop that supervises live tracking for every match"""
+    
+    def __init__(self, workers: int = 4):
+        """Start the loop thread; blocking Selenium calls run on a pool of worker threads"""
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="selenium")
+        self.loop.set_default_executor(self.executor)
+        self._thread = threading.Thread(target=self._run, name="tracking-loop", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Run the event loop until close() is called"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+    
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def call_soon(self, callback, *args):
+        """Run a callback on the loop thread"""
+        self.loop.call_soon_threadsafe(callback, *args)
+    
+    def close(self):
+        """Stop the loop and its worker threads"""
+        logger.info("Stopping tracking loop")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self.executor.shutdown(wait=False)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Any, Optional
 
@@ -7,8 +8,12 @@ class MatchStatus(str, Enum):
     LIVE = "LIVE"
     COMPLETED = "COMPLETED"
 
+@dataclass
 class Match:
     """Class representing a cricket match"""
+    # Python 3.9's dataclass has no slots=True, so the slots are listed by hand
+    __slots__ = ("id", "teams", "format", "dateTime", "url", "status")
+    
     id: str
     teams: str
     format: str
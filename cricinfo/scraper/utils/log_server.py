@@ -0,0 +1,34 @@
+import logging
+import logging.handlers
+import pickle
+import socketserver
+import struct
+from scraper.utils.logger import get_logger
+
+class LogRecordHandler(socketserver.StreamRequestHandler):
+    """Handle one connection from a logger set up with Logger.connect_to_aggregator()"""
+    
+    def handle(self):
+        """Log each length-prefixed, pickled record the client sends until it disconnects"""
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return
+            length = struct.unpack('>L', header)[0]
+            record = logging.makeLogRecord(pickle.loads(self.rfile.read(length)))
+            
+            # Written through this process's logger of the same name, which owns the log file
+            get_logger(record.name).logger.handle(record)
+
+class LogServer(socketserver.ThreadingTCPServer):
+    """TCP server collecting log records from scraper processes"""
+    allow_reuse_address = True
+    daemon_threads = True
+
+def serve(host="127.0.0.1", port=logging.handlers.DEFAULT_TCP_LOGGING_PORT):
+    """Collect log records until interrupted; only bind to trusted interfaces, records are unpickled"""
+    with LogServer((host, port), LogRecordHandler) as server:
+        server.serve_forever()
+
+if __name__ == "__main__":
+    serve()
\ No newline at end of file
@@ -1,53 +1,420 @@
-import os
-import logging
-from datetime import datetime
-
-class Logger:
-    """Custom logger for the cricket scraper"""
-    
-    def __init__(self, name="cricket_scraper"):
-        """Initialize the logger"""
-        self.name = name
-        
-        # Create logs directory if it doesn't exist
-        self.logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "logs")
-        os.makedirs(self.logs_dir, exist_ok=True)
-        
-        # Configure logger
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
-        
-        # Create formatter
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        
-        # Create file handler
-        log_file = os.path.join(self.logs_dir, f"{name}_{datetime.now().strftime('%Y-%m-%d')}.log")
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-    
-    def info(self, message):
-        """Log info message"""
-        self.logger.info(message)
-    
-    def warning(self, message):
-        """Log warning message"""
-        self.logger.warning(message)
-    
-    def error(self, message, exc_info=True):
-        """Log error message"""
-        self.logger.error(message, exc_info=exc_info)
-    
-    def debug(self, message):
-        """Log debug message"""
-        self.logger.debug(message)
-
-# Create default logger instance
-cricket_logger = Logger()
\ No newline at end of file
+import os
+import atexit
+import logging
+import logging.handlers
+import queue
+import struct
+import sys
+import threading
+import time
+from functools import lru_cache
+
+# The format doesn't use thread, process or task names, so skip looking them up for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+, a no-op before
+
+# Format of every log line
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Resolved once at import; the directory itself is created with the first logger
+LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "logs")
+
+# Queue listener per logger name; a second Logger(name) reuses it rather than adding handlers
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+# Binary event log per logger name, opened on the first binlog() call
+_binlogs = {}
+_binlogs_lock = threading.Lock()
+
+# Fixed-size binary event record: level, event code, timestamp (ns since epoch), value (float64)
+BINLOG_RECORD = struct.Struct('<BIqd')
+
+def _stop_listeners():
+    """Write out whatever is still queued when the process exits"""
+    with _listeners_lock:
+        for listener in _listeners.values():
+            listener.stop()
+
+# Registered after logging's own shutdown hook, so it runs first and the handlers are still open
+atexit.register(_stop_listeners)
+
+class CachedFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records logged within the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter with an empty timestamp cache"""
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, None, "")  # (epoch second, datefmt, formatted time)
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record's time, calling strftime at most once per second"""
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._cached_time
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, datefmt, formatted)
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+class FastFormatter(CachedFormatter):
+    """CachedFormatter specialized for LOG_FORMAT, building each line with an f-string instead of %-interpolation"""
+    
+    def __init__(self):
+        """Initialize the formatter for LOG_FORMAT"""
+        super().__init__(LOG_FORMAT)
+    
+    def format(self, record):
+        """Format a record exactly as LOG_FORMAT would"""
+        record.message = record.getMessage()
+        line = f"{self.formatTime(record)} - {record.name} - {record.levelname} - {record.message}"
+        
+        # Tracebacks and stack info are appended the way logging.Formatter does
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+class SamplingFilter(logging.Filter):
+    """Filter that keeps one in every n info and debug records, and every warning or worse"""
+    
+    def __init__(self, n=1):
+        """Initialize the filter; n=1 keeps everything"""
+        super().__init__()
+        self.n = max(1, n)
+        self.count = 0  # Only the listener thread filters, so no lock is needed
+    
+    def filter(self, record):
+        """Keep warnings and errors, and every nth record below that"""
+        if record.levelno >= logging.WARNING:
+            return True
+        self.count += 1
+        return self.count % self.n == 0
+
+class BufferedFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Rotating file handler that batches writes, flushing on warnings and errors or every flush_interval seconds"""
+    
+    def __init__(self, filename, buffer_size=64 * 1024, flush_interval=1.0, **kwargs):
+        """Open the log file with a large buffer and start the periodic flush thread"""
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, **kwargs)
+        # Python 3.10+ stores "locale" when no encoding is given, which str.encode doesn't accept
+        self._encoding = self.encoding if self.encoding not in (None, 'locale') else 'utf-8'
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True).start()
+    
+    def _open(self):
+        """Open the log file as a binary stream with buffer_size bytes of buffering instead of line buffering"""
+        # Records are encoded in emit, so writes skip the TextIOWrapper layer and its lock
+        return open(self.baseFilename, self.mode + 'b', buffering=self.buffer_size)
+    
+    def emit(self, record):
+        """Write a record, leaving it in the buffer unless it's a warning or worse"""
+        self._write([record])
+    
+    def handle_batch(self, records):
+        """Filter a burst of records from BatchQueueListener and write them with one lock and one write"""
+        records = [record for record in records if record.levelno >= self.level and self.filter(record)]
+        if not records:
+            return
+        with self.lock:
+            self._write(records)
+    
+    def _write(self, records):
+        """Write records to the buffer, flushing it if any is a warning or worse"""
+        try:
+            if self.shouldRollover(records[0]):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            data = "".join(self.format(record) + self.terminator for record in records)
+            self.stream.write(data.encode(self._encoding, self.errors or 'strict'))
+            if any(record.levelno >= logging.WARNING for record in records):
+                self.flush()
+        except Exception:
+            self.handleError(records[0])
+    
+    def _flush_periodically(self):
+        """Flush buffered records until the handler is closed"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """Stop the flush thread and close the file, flushing what's left"""
+        self._stop_flushing.set()
+        super().close()
+
+class StderrBytesHandler(logging.Handler):
+    """Console handler that writes encoded records straight to stderr's byte buffer.
+    
+    On a terminal every record is flushed; into a pipe (Docker logs, tee) only
+    warnings and errors are, and the rest every flush_interval seconds.
+    """
+    
+    def __init__(self, flush_interval=1.0):
+        """Set up the handler for the current stderr and start the periodic flush thread"""
+        super().__init__()
+        self.stream = sys.stderr.buffer
+        self.encoding = sys.stderr.encoding or 'utf-8'
+        self.flush_every_record = sys.stderr.isatty()
+        self.flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="console-flush", daemon=True).start()
+    
+    def emit(self, record):
+        """Write a record, flushing it right away on a terminal or if it's a warning or worse"""
+        try:
+            self.stream.write((self.format(record) + '\n').encode(self.encoding, 'backslashreplace'))
+            if self.flush_every_record or record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write buffered records to stderr"""
+        with self.lock:
+            self.stream.flush()
+    
+    def _flush_periodically(self):
+        """Flush buffered records until the handler is closed"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """Stop the flush thread, flushing what's left"""
+        self._stop_flushing.set()
+        self.flush()
+        super().close()
+
+class BinaryLog:
+    """Append-only file of fixed-size binary event records, for numeric events too frequent to log as text"""
+    
+    def __init__(self, path, buffer_size=64 * 1024, flush_interval=0.05):
+        """Open the file for appending and start the periodic flush thread"""
+        self.path = path
+        self.flush_interval = flush_interval
+        self._file = open(path, 'ab', buffering=buffer_size)
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="binlog-flush", daemon=True).start()
+    
+    def write(self, level, code, value):
+        """Append one record with an int or float value; it reaches the disk with the next flush"""
+        record = BINLOG_RECORD.pack(level, code, time.time_ns(), float(value))
+        with self._lock:
+            if not self._closed.is_set():
+                self._file.write(record)
+    
+    def flush(self):
+        """Write buffered records to the file"""
+        with self._lock:
+            if not self._closed.is_set():
+                self._file.flush()
+    
+    def _flush_periodically(self):
+        """Flush buffered records until the log is closed"""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """Flush and close the file"""
+        with self._lock:
+            self._closed.set()
+            self._file.close()
+
+def read_binlog(path):
+    """Yield (level, code, timestamp_ns, value) for each record in a binary event log, with value as a float"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # A record cut short by a crash mid-write is ignored
+    end = len(data) - len(data) % BINLOG_RECORD.size
+    yield from BINLOG_RECORD.iter_unpack(memoryview(data)[:end])
+
+class LocklessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues without taking the handler lock, since the queue is already thread-safe"""
+    
+    def handle(self, record):
+        """Filter and enqueue a record without serializing the calling threads"""
+        rv = self.filter(record)
+        if rv:
+            # Python 3.12+ filters may return a replacement record
+            if isinstance(rv, logging.LogRecord):
+                record = rv
+            self.emit(record)
+        return rv
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains records in bursts of up to batch_size.
+    
+    Handlers with a handle_batch() method get each burst in one call, others get records one at a time.
+    """
+    batch_size = 256
+    
+    def _monitor(self):
+        """Dequeue records until the sentinel, handling whatever has queued up together"""
+        while True:
+            record = self.dequeue(True)
+            batch = []
+            while record is not self._sentinel:
+                batch.append(self.prepare(record))
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+            if batch:
+                self.handle_batch(batch)
+            if record is self._sentinel:
+                break
+    
+    def handle_batch(self, records):
+        """Pass a burst of prepared records to every handler"""
+        for handler in self.handlers:
+            if hasattr(handler, 'handle_batch'):
+                handler.handle_batch(records)
+                continue
+            for record in records:
+                if not self.respect_handler_level or record.levelno >= handler.level:
+                    handler.handle(record)
+
+class Logger:
+    """Custom logger for the cricket scraper"""
+    
+    def __init__(self, name="cricket_scraper"):
+        """Initialize the logger"""
+        self.name = name
+        
+        self.logs_dir = LOGS_DIR
+        
+        # Configure logger
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.INFO)
+        
+        # getLogger returns the same logger for a name, so only attach handlers the first time
+        with _listeners_lock:
+            self._listener = _listeners.get(name)
+            if self._listener is None:
+                self._listener = _listeners[name] = self._start_listener()
+    
+    def _start_listener(self) -> logging.handlers.QueueListener:
+        """Attach a queue handler to the logger and start the thread writing its records"""
+        # Create logs directory if it doesn't exist
+        os.makedirs(self.logs_dir, exist_ok=True)
+        
+        # Create formatter
+        formatter = FastFormatter()
+        
+        # Create file handler, starting a new file each midnight and keeping two weeks of them
+        log_file = os.path.join(self.logs_dir, f"{self.name}.log")
+        file_handler = BufferedFileHandler(log_file, when='midnight', backupCount=14, delay=True, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        
+        # Set CRICINFO_LOG_SAMPLE=n to only write one in n info and debug records to the file;
+        # a bad value shouldn't stop the scraper starting, so it just turns sampling off
+        sample_setting = os.environ.get("CRICINFO_LOG_SAMPLE", "1")
+        try:
+            sample = int(sample_setting)
+        except ValueError:
+            sample = None
+        if sample and sample > 1:
+            file_handler.addFilter(SamplingFilter(sample))
+        
+        handlers = [file_handler]
+        
+        # Only echo to the console when someone is watching it; otherwise (Docker, cron, systemd)
+        # stderr is captured and written to disk a second time. Set CRICINFO_LOG_CONSOLE=1 to force it
+        if os.environ.get("CRICINFO_LOG_CONSOLE", "0") != "0" or sys.stderr.isatty():
+            # A replaced stderr without a byte buffer gets a plain StreamHandler
+            console_handler = StderrBytesHandler() if hasattr(sys.stderr, 'buffer') else logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+        
+        # Log calls only enqueue the record; a listener thread formats and writes it
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(LocklessQueueHandler(log_queue))
+        listener = BatchQueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        
+        if sample is None:
+            self.logger.warning("Ignoring CRICINFO_LOG_SAMPLE=%r, expected a whole number; writing every record", sample_setting)
+        return listener
+    
+    def connect_to_aggregator(self, host="127.0.0.1", port=logging.handlers.DEFAULT_TCP_LOGGING_PORT):
+        """Send this logger's records to a log_server process instead of writing the log file here.
+        
+        Use it in worker processes so one process owns the log file.
+        """
+        with _listeners_lock:
+            # Keep the queue, so logging calls still never touch the socket
+            local = self._listener
+            local.stop()
+            for handler in local.handlers:
+                handler.close()
+            self._listener = _listeners[self.name] = BatchQueueListener(local.queue, logging.handlers.SocketHandler(host, port))
+            self._listener.start()
+    
+    # Pass %-style arguments rather than f-strings, e.g. debug("scraped %s in %.2fs", url, elapsed),
+    # so messages below the logger's level are never formatted
+    def info(self, message, *args, **kwargs):
+        """Log info message"""
+        self.logger.info(message, *args, **kwargs)
+    
+    def warning(self, message, *args, **kwargs):
+        """Log warning message"""
+        self.logger.warning(message, *args, **kwargs)
+    
+    def error(self, message, *args, exc_info=None, **kwargs):
+        """Log error message, with the traceback if it's logged while handling an exception"""
+        if exc_info is None:
+            exc_info = sys.exc_info()[0] is not None
+        self.logger.error(message, *args, exc_info=exc_info, **kwargs)
+    
+    def debug(self, message, *args, **kwargs):
+        """Log debug message"""
+        self.logger.debug(message, *args, **kwargs)
+    
+    # Awaitable versions for coroutines. The sync calls only put the record on the listener's
+    # SimpleQueue, which never blocks, so these don't need a queue of their own
+    async def ainfo(self, message, *args, **kwargs):
+        """Log info message from a coroutine"""
+        self.info(message, *args, **kwargs)
+    
+    async def awarning(self, message, *args, **kwargs):
+        """Log warning message from a coroutine"""
+        self.warning(message, *args, **kwargs)
+    
+    async def aerror(self, message, *args, exc_info=None, **kwargs):
+        """Log error message from a coroutine"""
+        self.error(message, *args, exc_info=exc_info, **kwargs)
+    
+    async def adebug(self, message, *args, **kwargs):
+        """Log debug message from a coroutine"""
+        self.debug(message, *args, **kwargs)
+    
+    def binlog(self, code, value, level=logging.INFO):
+        """Record a numeric event (e.g. a scrape duration in ms) in <name>.log.bin, skipping text formatting.
+        
+        value may be an int or a float and is stored as a float64; decode the file with read_binlog().
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        with _binlogs_lock:
+            binary_log = _binlogs.get(self.name)
+            if binary_log is None:
+                os.makedirs(self.logs_dir, exist_ok=True)
+                binary_log = _binlogs[self.name] = BinaryLog(os.path.join(self.logs_dir, f"{self.name}.log.bin"))
+                atexit.register(binary_log.close)
+        binary_log.write(level, code, value)
+
+@lru_cache(maxsize=None)
+def get_logger(name="cricket_scraper") -> Logger:
+    """Get the logger for name, creating it on first use rather than at import"""
+    return Logger(name)
\ No newline at end of file
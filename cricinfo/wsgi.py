@@ -0,0 +1,3 @@
+# WSGI entry point, run with:
+#   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+from api import app